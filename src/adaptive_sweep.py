@@ -0,0 +1,164 @@
+import numpy as np
+
+from src.ballistics import GRADIENT_PARAMETERS, lane2012_gradients
+
+class AdaptiveSweep:
+    """
+    Adaptive refinement of a parameter sweep.
+
+    The parameter box is covered by a coarse grid of cells. After each wave, a cell
+    whose corner outputs differ by more than the tolerance is split into 2^d
+    children, and only the new corner points are evaluated, all in one batch. Flat
+    regions therefore keep their coarse cells while sharp changes in the response
+    are resolved down to max_depth halvings of the coarse grid.
+
+    Points are stored on an integer lattice at the finest resolution, so corners
+    shared between neighbouring cells are evaluated once.
+
+    With max_evaluations set, cells over the tolerance are split in order of
+    decreasing corner spread, and only while the new corners they need still fit
+    in the budget, so the total number of evaluations never exceeds it. Corners
+    where the model returns NaN (e.g. particles that are not lofted) count as one
+    regime: a cell whose corners are all NaN is flat, and one mixing NaN and finite
+    corners is refined.
+    """
+
+    def __init__(self, model, bounds, initial_points=5, tolerance=1.0, max_depth=6, log_scale=None,
+                 max_evaluations=None):
+        """
+        :param model: Vectorized function mapping an (n, d) array of points to n outputs.
+        :param bounds: List of (low, high) per dimension.
+        :param initial_points: Points per dimension of the coarse grid.
+        :param tolerance: Largest allowed output difference across a cell's corners.
+        :param max_depth: Maximum number of times a coarse cell may be halved.
+        :param log_scale: Booleans per dimension; True spaces that dimension logarithmically.
+        :param max_evaluations: Hard cap on the number of evaluated points; must cover
+            the initial_points^d coarse grid.
+        """
+        if max_evaluations is not None and max_evaluations < initial_points**len(bounds):
+            raise ValueError(f"max_evaluations must be at least {initial_points**len(bounds)} for the coarse grid")
+        self.model = model
+        self.bounds = np.asarray(bounds, dtype=float)
+        self.dims = len(self.bounds)
+        self.tolerance = tolerance
+        self.max_depth = max_depth
+        self.max_evaluations = max_evaluations
+        self.log_scale = np.zeros(self.dims, dtype=bool) if log_scale is None else np.asarray(log_scale, dtype=bool)
+        self.base_size = 2**max_depth
+        self.extent = (initial_points - 1) * self.base_size
+        self.values = {}
+        self.leaves = []
+        self.waves = 0
+
+        origins = np.stack(np.meshgrid(*[np.arange(initial_points - 1) * self.base_size] * self.dims,
+                                       indexing='ij'), axis=-1).reshape(-1, self.dims)
+        self._active = [(tuple(origin), self.base_size) for origin in origins]
+        self._offsets = np.stack(np.meshgrid(*[[0, 1]] * self.dims, indexing='ij'), axis=-1).reshape(-1, self.dims)
+
+    def to_physical(self, lattice):
+        """Map integer lattice coordinates to parameter values."""
+        fraction = np.asarray(lattice, dtype=float) / self.extent
+        low, high = self.bounds[:, 0], self.bounds[:, 1]
+        linear = low + fraction * (high - low)
+        log_low = np.log(np.where(self.log_scale, low, 1))
+        log_high = np.log(np.where(self.log_scale, high, 1))
+        logarithmic = np.exp(log_low + fraction * (log_high - log_low))
+        return np.where(self.log_scale, logarithmic, linear)
+
+    def _corners(self, cell):
+        origin, size = cell
+        return [tuple(corner) for corner in np.asarray(origin) + size * self._offsets]
+
+    def _spread(self, cell):
+        corner_values = np.array([self.values[corner] for corner in self._corners(cell)])
+        missing = np.isnan(corner_values)
+        if missing.all():
+            return 0.0
+        if missing.any() or not np.all(np.isfinite(corner_values)):
+            return np.inf
+        return np.ptp(corner_values)
+
+    def step(self):
+        """
+        Evaluate one wave of cells and split those that exceed the tolerance.
+
+        :return: Number of new points evaluated in this wave.
+        """
+        new_points = sorted({corner for cell in self._active for corner in self._corners(cell)} - self.values.keys())
+        if new_points:
+            outputs = np.asarray(self.model(self.to_physical(np.array(new_points))), dtype=float)
+            self.values.update(zip(new_points, outputs))
+        self.waves += 1
+
+        spreads = [self._spread(cell) for cell in self._active]
+        budget = np.inf if self.max_evaluations is None else self.max_evaluations - len(self.values)
+        planned = set()
+        refined = []
+        for i in np.argsort(spreads, kind='stable')[::-1]:
+            cell = self._active[i]
+            if cell[1] > 1 and spreads[i] > self.tolerance:
+                half = cell[1] // 2
+                children = [(tuple(np.asarray(cell[0]) + half * offset), half) for offset in self._offsets]
+                corners = {corner for child in children for corner in self._corners(child)
+                           if corner not in self.values and corner not in planned}
+                if len(corners) <= budget:
+                    budget -= len(corners)
+                    planned |= corners
+                    refined.extend(children)
+                    continue
+            self.leaves.append(cell)
+        self._active = refined
+        return len(new_points)
+
+    def run(self):
+        """
+        Refine until every cell meets the tolerance, reaches max_depth or the budget runs out.
+
+        :return: Tuple (points, values): evaluated parameter points (n, d) and model outputs (n,).
+        """
+        while self._active:
+            self.step()
+        return self.points()
+
+    def points(self):
+        """Return all evaluated points and their outputs, in lattice order."""
+        lattice = sorted(self.values)
+        return self.to_physical(np.array(lattice)), np.array([self.values[point] for point in lattice])
+
+    def leaf_cells(self):
+        """Return the final cells as (lower corner, upper corner) parameter arrays."""
+        lower = np.array([cell[0] for cell in self.leaves])
+        upper = lower + np.array([cell[1] for cell in self.leaves])[:, None]
+        return self.to_physical(lower), self.to_physical(upper)
+
+def landing_range_model(names, **fixed):
+    """
+    Vectorized Lane 2012 landing range as a function of the named parameters.
+
+    :param names: Swept parameters, a subset of GRADIENT_PARAMETERS.
+    :param fixed: Values for the other lane2012_gradients arguments.
+    :return: Function mapping an (n, len(names)) array to n landing ranges.
+    """
+    for name in names:
+        if name not in GRADIENT_PARAMETERS:
+            raise ValueError(f"Unknown sweep parameter: {name}")
+
+    def model(points):
+        params = dict(fixed, **{name: points[:, i] for i, name in enumerate(names)})
+        return lane2012_gradients(**params)['landing_range']
+    return model
+
+def adaptive_landing_sweep(bounds, fixed, tolerance, **kwargs):
+    """
+    Adaptively sweep the Lane 2012 landing range over one or more parameters.
+
+    :param bounds: Dict of swept parameter -> (low, high), e.g. {'u_g': (500, 2000)}.
+    :param fixed: Values for the remaining lane2012_gradients arguments.
+    :param tolerance: Largest allowed landing-range difference across a cell (m).
+    :param kwargs: Passed to AdaptiveSweep.
+    :return: The finished AdaptiveSweep.
+    """
+    names = list(bounds)
+    sweep = AdaptiveSweep(landing_range_model(names, **fixed), [bounds[name] for name in names], tolerance=tolerance, **kwargs)
+    sweep.run()
+    return sweep
@@ -1,5 +1,7 @@
 import math
 
+REGOLITH_DENSITY = 3000  # Lunar regolith density (kg/m^3)
+
 def calculate_drag_force(C_d, rho_g, A_p, u_g, v_0):
     """Calculate the drag force on the particle."""
     return 0.5 * C_d * rho_g * A_p * (u_g - v_0)**2
@@ -7,7 +9,7 @@ def calculate_drag_force(C_d, rho_g, A_p, u_g, v_0):
 def calculate_initial_velocity(C_d, rho_g, d_p, u_g, gravity, time_step):
     """Estimate the initial velocity of the particle."""
     A_p = math.pi * (d_p / 2)**2
-    m_p = (4/3) * math.pi * (d_p / 2)**3 * 3000  # Assuming lunar regolith density ~3000 kg/m^3
+    m_p = (4/3) * math.pi * (d_p / 2)**3 * REGOLITH_DENSITY
     
     drag_force = calculate_drag_force(C_d, rho_g, A_p, u_g, 0)
     acceleration = (drag_force - m_p * gravity) / m_p
@@ -97,3 +99,166 @@ def calculate_trajectory(v_0, launch_angle, gravity, initial_position=(0, 0), ti
         t += time_step
 
     return trajectory
+
+def lane2012_height(y, x_0, y_0, s_0, b, g, v_0):
+    """
+    Evaluate the Lane 2012 trajectory height at horizontal positions y.
+
+    Vectorized counterpart of calculate_trajectory_lane2012: all arguments may be
+    NumPy arrays and are broadcast against each other, so many particles and many
+    abscissae can be evaluated in one call. Heights are not clipped at the surface.
+
+    :param y: Horizontal position(s) from plume center (m), y >= y_0.
+    :return: Array of vertical positions (m).
+    """
+    # NumPy is imported on first use so importing this module stays cheap.
+    import numpy as np
+
+    y = np.asarray(y, dtype=float)
+    dy = y - y_0
+    return (x_0 + s_0 * dy) + (b * x_0 - s_0 * y_0) * (dy / y_0 - np.log(y / y_0)) - (g * dy**2) / (2 * v_0**2)
+
+def calculate_launch_angles(plume_velocity, stagnation_velocity, radial_distance, max_distance):
+    """
+    Vectorized calculate_launch_angle: arguments may be NumPy arrays and are broadcast.
+
+    :return: Array of launch angles in degrees.
+    """
+    import numpy as np
+
+    ratio = np.asarray(radial_distance, dtype=float) / max_distance
+    return np.degrees(np.arctan2(stagnation_velocity * (1 - ratio), plume_velocity * ratio))
+
+def kinematic_landing(v_0, launch_angle, gravity):
+    """
+    Closed-form landing distance and apex of the kinematic model in calculate_trajectory.
+
+    Evaluates a surface launch analytically instead of time-stepping, so arrays of
+    particles are handled in one pass. Particles with v_0 <= 0 are not lofted and
+    get zero distance and apex.
+
+    :param v_0: Initial velocity (m/s).
+    :param launch_angle: Launch angle in degrees.
+    :param gravity: Gravitational acceleration (m/s^2).
+    :return: Tuple (landing_distance, apex) of arrays, relative to the launch point.
+    """
+    import numpy as np
+
+    v_0 = np.maximum(np.asarray(v_0, dtype=float), 0.0)
+    theta = np.radians(launch_angle)
+    landing_distance = v_0**2 * np.sin(2 * theta) / gravity
+    apex = (v_0 * np.sin(theta))**2 / (2 * gravity)
+    return landing_distance, apex
+
+# Parameters lane2012_gradients differentiates with respect to
+GRADIENT_PARAMETERS = ['d_p', 'u_g', 'g', 'C_d', 's_0', 'b']
+
+def _first_crossing(f, y_0, y_end, num_points=512, iterations=60):
+    """
+    Locate, per element, the first y in (y_0, y_end] where f(y) changes from >= 0 to < 0.
+
+    f is scanned on a geometric grid and the crossing is refined by bisection.
+    Elements without a crossing get NaN.
+    """
+    import numpy as np
+
+    fractions = np.geomspace(1e-9, 1, num_points)
+    grid = y_0[..., None] * (y_end / y_0)[..., None] ** fractions
+    values = f(grid, lambda a: a[..., None])
+    negative = values < 0
+    found = negative.any(axis=-1)
+    index = np.where(found, negative.argmax(axis=-1), 1)
+    low = np.take_along_axis(grid, np.maximum(index - 1, 0)[..., None], axis=-1)[..., 0]
+    high = np.take_along_axis(grid, index[..., None], axis=-1)[..., 0]
+    low = np.where(index == 0, y_0, low)
+    for _ in range(iterations):
+        mid = 0.5 * (low + high)
+        below = f(mid, lambda a: a) < 0
+        high = np.where(below, mid, high)
+        low = np.where(below, low, mid)
+    return np.where(found, 0.5 * (low + high), np.nan)
+
+def lane2012_gradients(d_p, u_g, g, C_d, s_0, b, x_0=0.01, y_0=0.01, rho_g=0.01, time_step=0.01):
+    """
+    Landing range and apex of the Lane 2012 trajectory with their analytic gradients.
+
+    The initial velocity comes from calculate_initial_velocity, which in closed form is
+    v_0 = (0.75 C_d rho_g u_g^2 / (rho_p d_p) - g) * time_step. The landing range Y is
+    the first root of the Lane 2012 height h(y) beyond y_0, and its derivatives follow
+    from implicit differentiation, dY/dp = -(dh/dp) / (dh/dy). The apex is h at the
+    first stationary point, so by the envelope theorem dH/dp = dh/dp there; if the
+    trajectory starts out descending the apex is the launch height x_0.
+
+    Particles with v_0 <= 0 are not lofted (drag does not overcome gravity). The
+    height formula only sees v_0^2, so such particles would otherwise get a landing
+    range and gradients with the wrong sign; their outputs are NaN instead.
+
+    All arguments may be NumPy arrays and are broadcast, so a whole design is
+    evaluated in one vectorized pass.
+
+    :return: Dict with arrays 'v_0', 'lofted', 'landing_range', 'apex', 'apex_position',
+        and 'd_landing_range' and 'd_apex', dicts of derivatives keyed by GRADIENT_PARAMETERS.
+        Landing quantities are NaN if the particle does not land within 1e12 m, and
+        all outputs but v_0 and lofted are NaN where the particle is not lofted.
+    """
+    import numpy as np
+
+    d_p, u_g, g, C_d, s_0, b, x_0, y_0 = np.broadcast_arrays(
+        *(np.asarray(a, dtype=float) for a in (d_p, u_g, g, C_d, s_0, b, x_0, y_0)))
+    rho_p = REGOLITH_DENSITY
+
+    # Initial velocity and its derivatives
+    drag = 0.75 * C_d * rho_g * u_g**2 / (rho_p * d_p)
+    v_0 = (drag - g) * time_step
+    dv_0 = {
+        'd_p': -drag / d_p * time_step,
+        'u_g': 2 * drag / u_g * time_step,
+        'g': -time_step * np.ones_like(v_0),
+        'C_d': drag / C_d * time_step,
+    }
+
+    c = b * x_0 - s_0 * y_0
+
+    def height(y, e):
+        dy = y - e(y_0)
+        return (e(x_0) + e(s_0) * dy) + e(c) * (dy / e(y_0) - np.log(y / e(y_0))) - e(g) * dy**2 / (2 * e(v_0)**2)
+
+    def slope(y, e):
+        return e(s_0) + e(c) * (1 / e(y_0) - 1 / y) - e(g) * (y - e(y_0)) / e(v_0)**2
+
+    def partials(y):
+        """Partial derivatives of h(y) with respect to each parameter, v_0 dependence included."""
+        dy = y - y_0
+        dh_dv_0 = g * dy**2 / v_0**3
+        result = {name: dh_dv_0 * dv_0[name] for name in dv_0}
+        result['g'] = result['g'] - dy**2 / (2 * v_0**2)
+        result['s_0'] = y_0 * np.log(y / y_0)
+        result['b'] = x_0 * (dy / y_0 - np.log(y / y_0))
+        return result
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        landing = _first_crossing(height, y_0, y_0 + 1e12)
+        dh_dy = slope(landing, lambda a: a)
+        d_landing = {name: -value / dh_dy for name, value in partials(landing).items()}
+
+        # Apex: first point where the slope turns negative, if before landing
+        turn = _first_crossing(slope, y_0, np.where(np.isfinite(landing), landing, y_0 + 1e12))
+        rising = (s_0 > 0) & np.isfinite(turn)
+        apex_position = np.where(rising, turn, y_0)
+        apex = np.where(rising, height(apex_position, lambda a: a), x_0)
+        d_apex = {name: np.where(rising, value, 0.0) for name, value in partials(apex_position).items()}
+
+    lofted = v_0 > 0
+
+    def mask(values):
+        return np.where(lofted, values, np.nan)
+
+    return {
+        'v_0': v_0,
+        'lofted': lofted,
+        'landing_range': mask(landing),
+        'apex': mask(apex),
+        'apex_position': mask(apex_position),
+        'd_landing_range': {name: mask(d_landing[name]) for name in GRADIENT_PARAMETERS},
+        'd_apex': {name: mask(d_apex[name]) for name in GRADIENT_PARAMETERS},
+    }
@@ -0,0 +1,152 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.ballistics import lane2012_height
+from src.verification import LUNAR_GRAVITY, REFERENCE_CASES, load_reference_curve
+
+# Fitted Lane 2012 parameters, in the order used by the solver
+CALIBRATION_PARAMETERS = ['b', 's_0', 'v_0']
+
+# Ranges that multi-start initial guesses are drawn from (log-uniformly)
+DEFAULT_BOUNDS = {'b': (1e-2, 1e3), 's_0': (1e-3, 1), 'v_0': (10, 1e4)}
+
+def _pad(curves):
+    """Stack curves of different lengths into (C, P) arrays with a validity mask."""
+    size = max(len(x) for x, _ in curves)
+    x = np.ones((len(curves), size))
+    y = np.ones((len(curves), size))
+    mask = np.zeros((len(curves), size), dtype=bool)
+    for i, (curve_x, curve_y) in enumerate(curves):
+        x[i, :len(curve_x)] = curve_x
+        y[i, :len(curve_y)] = curve_y
+        mask[i, :len(curve_x)] = True
+    return x, y, mask
+
+def _residuals(theta, x, y, mask, x_0, y_0, g):
+    """
+    Relative residuals (h - y) / y and their Jacobian with respect to (b, s_0, v_0).
+
+    theta has shape (C, S, 3) for C curves and S starts; x, y and mask have shape (C, 1, P).
+    """
+    b, s_0, v_0 = (theta[..., i:i + 1] for i in range(3))
+    dy = x - y_0
+    log_ratio = np.log(x / y_0)
+    h = lane2012_height(x, x_0, y_0, s_0, b, g, v_0)
+    residual = np.where(mask, (h - y) / y, 0.0)
+    jacobian = np.stack(np.broadcast_arrays(
+        x_0 * (dy / y_0 - log_ratio),
+        y_0 * log_ratio,
+        g * dy**2 / v_0**3,
+    ), axis=-1)
+    jacobian = np.where(mask[..., None], jacobian / y[..., None], 0.0)
+    return residual, jacobian
+
+def _levenberg_marquardt(theta, x, y, mask, x_0, y_0, g, max_iterations, tolerance):
+    """Batched Levenberg-Marquardt over all curves and starts at once."""
+    damping = np.full(theta.shape[:-1], 1e-3)
+    residual, jacobian = _residuals(theta, x, y, mask, x_0, y_0, g)
+    cost = (residual**2).sum(axis=-1)
+    converged = np.zeros(theta.shape[:-1], dtype=bool)
+    for _ in range(max_iterations):
+        jtj = np.einsum('...pi,...pj->...ij', jacobian, jacobian)
+        jtr = np.einsum('...pi,...p->...i', jacobian, residual)
+        diagonal = np.einsum('...ii->...i', jtj)
+        system = jtj + (damping[..., None] * np.maximum(diagonal, 1e-30))[..., None] * np.eye(3)
+        step = np.linalg.solve(system, -jtr[..., None])[..., 0]
+
+        trial = theta + step
+        trial_residual, trial_jacobian = _residuals(trial, x, y, mask, x_0, y_0, g)
+        trial_cost = (trial_residual**2).sum(axis=-1)
+        better = np.isfinite(trial_cost) & (trial_cost < cost) & ~converged
+
+        converged |= better & (cost - trial_cost <= tolerance * np.maximum(cost, 1e-300))
+        theta = np.where(better[..., None], trial, theta)
+        residual = np.where(better[..., None], trial_residual, residual)
+        jacobian = np.where(better[..., None, None], trial_jacobian, jacobian)
+        cost = np.where(better, trial_cost, cost)
+        damping = np.where(better, damping / 10, np.minimum(damping * 10, 1e12))
+        if converged.all():
+            break
+    return theta, cost
+
+def calibrate_curves(curves, x_0, y_0, g=LUNAR_GRAVITY, num_starts=32, bounds=None, max_iterations=200,
+                     tolerance=1e-12, seed=0):
+    """
+    Fit the Lane 2012 parameters b, s_0 and v_0 to reference curves by least squares.
+
+    Residuals are relative height errors (h(x) - y) / y at the reference points, so
+    curves spanning several decades are weighted evenly. Every curve is fitted from
+    num_starts log-uniform initial guesses, and all curves and starts are solved
+    together in one batched Levenberg-Marquardt iteration with analytic Jacobians.
+
+    :param curves: List of (x, y) reference arrays (horizontal, vertical positions).
+    :param x_0: Launch height(s), scalar or one per curve.
+    :param y_0: Launch radius (radii), scalar or one per curve.
+    :param g: Gravitational acceleration (m/s^2).
+    :param num_starts: Initial guesses per curve.
+    :param bounds: Dict of parameter -> (low, high) for initial guesses; defaults to DEFAULT_BOUNDS.
+    :return: List of dicts, one per curve, with 'b', 's_0', 'v_0' and 'rms' (relative residual).
+    """
+    if not curves:
+        return []
+    bounds = dict(DEFAULT_BOUNDS, **(bounds or {}))
+    x, y, mask = _pad(curves)
+    n = len(curves)
+    x_0 = np.broadcast_to(np.asarray(x_0, dtype=float), (n,))[:, None, None]
+    y_0 = np.broadcast_to(np.asarray(y_0, dtype=float), (n,))[:, None, None]
+
+    rng = np.random.default_rng(seed)
+    low = np.log([bounds[name][0] for name in CALIBRATION_PARAMETERS])
+    high = np.log([bounds[name][1] for name in CALIBRATION_PARAMETERS])
+    theta = np.exp(rng.uniform(low, high, (n, num_starts, 3)))
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        theta, cost = _levenberg_marquardt(theta, x[:, None, :], y[:, None, :], mask[:, None, :],
+                                           x_0, y_0, g, max_iterations, tolerance)
+    cost = np.where(np.isfinite(cost), cost, np.inf)
+    best = cost.argmin(axis=1)
+    results = []
+    for i in range(n):
+        b, s_0, v_0 = theta[i, best[i]]
+        results.append({'b': float(b), 's_0': float(s_0), 'v_0': float(abs(v_0)),
+                        'rms': float(np.sqrt(cost[i, best[i]] / mask[i].sum()))})
+    return results
+
+def _calibrate_item(item):
+    """Process-pool entry point: calibrate one batch of curves."""
+    curves, x_0, y_0, g, kwargs = item
+    return calibrate_curves(curves, x_0, y_0, g, **kwargs)
+
+def calibrate_reference_cases(cases=None, reference_dir='.', g=LUNAR_GRAVITY, max_workers=None,
+                              batch_size=64, **kwargs):
+    """
+    Calibrate b, s_0 and v_0 for a library of reference cases.
+
+    Curves are loaded as in verify_cases and fitted in batches of batch_size curves,
+    with batches spread across worker processes.
+
+    :param cases: Dict of case name -> dict with 'x_0' and 'y_0' (and optionally 'file');
+        defaults to REFERENCE_CASES.
+    :param max_workers: Number of worker processes; 1 runs serially in-process.
+    :param kwargs: Passed to calibrate_curves.
+    :return: Dict of case name -> fitted parameters.
+    """
+    if cases is None:
+        cases = REFERENCE_CASES
+    names = list(cases)
+    curves = [load_reference_curve(cases[name].get('file', os.path.join(reference_dir, name + '.csv')))
+              for name in names]
+    items = [(curves[start:start + batch_size],
+              [cases[name]['x_0'] for name in names[start:start + batch_size]],
+              [cases[name]['y_0'] for name in names[start:start + batch_size]],
+              g, kwargs)
+             for start in range(0, len(names), batch_size)]
+
+    if max_workers == 1 or len(items) <= 1:
+        results = list(map(_calibrate_item, items))
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_calibrate_item, items))
+    return dict(zip(names, (fit for batch in results for fit in batch)))
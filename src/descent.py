@@ -0,0 +1,131 @@
+import math
+
+import numpy as np
+
+from src.ballistics import REGOLITH_DENSITY, calculate_launch_angles, kinematic_landing
+from src.plume_model import estimate_gas_velocity, estimate_drag_coefficient
+
+class DescentEngine:
+    """
+    Run an ejecta population through a thrust/altitude descent profile.
+
+    Work is split by what it depends on so each altitude step only recomputes
+    what changed since the previous step:
+
+    - particle properties (drag-to-mass ratio per particle) depend only on the
+      population and are computed once;
+    - gas velocity depends on thrust and is cached per thrust level;
+    - initial velocities are recomputed only when the gas velocity changes by more
+      than rtol, and launch angles only when the gas velocity or the impingement
+      radius does.
+
+    The impingement radius is taken as impingement_ratio * altitude. Particles
+    outside it, or whose drag cannot overcome gravity, are not lofted; at zero
+    altitude no particle is lofted.
+    """
+
+    def __init__(self, particle_diameters, radial_distances, nozzle_area, exhaust_velocity,
+                 gas_density=0.01, gravity=1.62, time_step=0.01, stagnation_velocity=200,
+                 impingement_ratio=5.0, rtol=1e-3):
+        """
+        :param particle_diameters: Particle diameters (m), one per particle.
+        :param radial_distances: Launch distance of each particle from the plume center (m).
+        :param nozzle_area: Nozzle exit area (m^2).
+        :param exhaust_velocity: Engine exhaust velocity (m/s).
+        :param gas_density: Gas density near the surface (kg/m^3).
+        :param gravity: Gravitational acceleration (m/s^2).
+        :param time_step: Drag impulse duration used to estimate the initial velocity (s).
+        :param stagnation_velocity: Vertical gas velocity at the plume center (m/s).
+        :param impingement_ratio: Impingement radius per metre of altitude.
+        :param rtol: Relative change in gas velocity or impingement radius below which
+            cached results from the previous step are reused.
+        """
+        self.d_p = np.asarray(particle_diameters, dtype=float)
+        self.r = np.asarray(radial_distances, dtype=float)
+        self.nozzle_area = nozzle_area
+        self.exhaust_velocity = exhaust_velocity
+        self.gravity = gravity
+        self.time_step = time_step
+        self.stagnation_velocity = stagnation_velocity
+        self.impingement_ratio = impingement_ratio
+        self.rtol = rtol
+
+        # Particle properties: drag force per unit mass and per (m/s)^2 of slip velocity
+        C_d = np.array([estimate_drag_coefficient(d) for d in self.d_p])
+        A_p = math.pi * (self.d_p / 2)**2
+        m_p = (4/3) * math.pi * (self.d_p / 2)**3 * REGOLITH_DENSITY
+        self._drag_per_mass = 0.5 * C_d * gas_density * A_p / m_p
+
+        self._gas_velocity_cache = {}
+        self._u_g = None
+        self._radius = None
+        self._v_0 = None
+        self._launch_angle = None
+        self._result = None
+        self.stats = {'steps': 0, 'gas_velocity': 0, 'initial_velocity': 0, 'launch_angle': 0, 'landing': 0}
+
+    def gas_velocity(self, thrust, altitude):
+        """Return the surface gas velocity for a thrust level, cached per thrust."""
+        if thrust not in self._gas_velocity_cache:
+            self._gas_velocity_cache[thrust] = estimate_gas_velocity(thrust, self.nozzle_area, altitude, self.exhaust_velocity)
+            self.stats['gas_velocity'] += 1
+        return self._gas_velocity_cache[thrust]
+
+    def _changed(self, old, new):
+        return old is None or abs(new - old) > self.rtol * abs(old)
+
+    def step(self, altitude, thrust):
+        """
+        Advance to one altitude step and return the population result.
+
+        :param altitude: Lander altitude (m).
+        :param thrust: Engine thrust (N).
+        :return: Dict with 'altitude', 'thrust', 'gas_velocity', 'impingement_radius',
+            'reused' (True if the per-particle arrays were carried over from an earlier
+            step within rtol) and per-particle arrays 'v_0', 'launch_angle', 'lofted',
+            'landing_range', 'apex'.
+        """
+        self.stats['steps'] += 1
+        u_g = self.gas_velocity(thrust, altitude)
+        radius = self.impingement_ratio * altitude
+
+        u_g_changed = self._changed(self._u_g, u_g)
+        radius_changed = self._changed(self._radius, radius)
+
+        if u_g_changed:
+            self._u_g = u_g
+            self._v_0 = (self._drag_per_mass * u_g**2 - self.gravity) * self.time_step
+            self.stats['initial_velocity'] += 1
+
+        if u_g_changed or radius_changed:
+            self._radius = radius
+            if radius > 0:
+                self._launch_angle = calculate_launch_angles(self._u_g, self.stagnation_velocity, self.r, radius)
+                lofted = (self._v_0 > 0) & (self.r < radius)
+            else:
+                # Touchdown: there is no impingement zone to launch from
+                self._launch_angle = np.zeros_like(self.r)
+                lofted = np.zeros(self.r.shape, dtype=bool)
+            self.stats['launch_angle'] += 1
+
+            landing_distance, apex = kinematic_landing(np.where(lofted, self._v_0, 0.0), self._launch_angle, self.gravity)
+            self._result = {
+                'v_0': self._v_0,
+                'launch_angle': self._launch_angle,
+                'lofted': lofted,
+                'landing_range': self.r + landing_distance,
+                'apex': apex,
+            }
+            self.stats['landing'] += 1
+
+        return dict(self._result, altitude=altitude, thrust=thrust, gas_velocity=u_g, impingement_radius=radius,
+                    reused=not (u_g_changed or radius_changed))
+
+    def run(self, profile):
+        """
+        Step through a descent profile.
+
+        :param profile: Iterable of (altitude, thrust) pairs, in flight order.
+        :return: List of step results (see step).
+        """
+        return [self.step(altitude, thrust) for altitude, thrust in profile]
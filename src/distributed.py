@@ -0,0 +1,394 @@
+"""
+Distributed population and sweep runs.
+
+Particle populations and parameter designs are split into chunks that rank 0
+hands out on demand, so faster ranks take more chunks. Histograms are reduced
+with a collective sum and sensitivity outputs are gathered on rank 0.
+
+Under MPI (mpi4py installed, launched with e.g. ``mpiexec -n 8 python -m src.distributed``)
+the drivers use COMM_WORLD. Without MPI, run_local starts several ranks as local
+processes connected by LocalComm, which implements the subset of the mpi4py
+communicator API used here.
+
+If a chunk fails on any rank, the exception is sent back to rank 0, which stops
+every other rank and re-raises it; the other ranks raise ScheduleAborted.
+"""
+import argparse
+import multiprocessing
+import operator
+import pickle
+import queue
+import traceback
+
+import numpy as np
+
+from src.population import evaluate_batch, population_params
+
+try:
+    from mpi4py import MPI
+except ImportError:
+    MPI = None
+
+ANY_SOURCE = MPI.ANY_SOURCE if MPI is not None else -1
+ANY_TAG = MPI.ANY_TAG if MPI is not None else -1
+
+# Message tags for the chunk scheduler
+TAG_WORK = 1
+TAG_RESULT = 2
+TAG_STOP = 3
+TAG_ERROR = 4
+
+# Tag reserved for LocalComm collectives
+_TAG_COLLECTIVE = 1 << 30
+
+class ScheduleAborted(RuntimeError):
+    """Raised on worker ranks when rank 0 stops a run because a chunk failed."""
+
+class LocalStatus:
+    """Stand-in for MPI.Status."""
+
+    def __init__(self):
+        self.source = None
+        self.tag = None
+
+    def Get_source(self):
+        return self.source
+
+    def Get_tag(self):
+        return self.tag
+
+class LocalComm:
+    """Message-passing communicator between local processes, API-compatible with mpi4py's lowercase methods."""
+
+    def __init__(self, rank, inboxes, processes=None, poll_interval=0.1):
+        """
+        :param rank: Rank of this process.
+        :param inboxes: One multiprocessing queue per rank.
+        :param processes: Dict of rank -> Process for the other ranks; if given, recv
+            checks them every poll_interval seconds and raises instead of waiting on a
+            rank that has died.
+        """
+        self.rank = rank
+        self.size = len(inboxes)
+        self._inboxes = inboxes
+        self._pending = []
+        self._processes = processes or {}
+        self._poll_interval = poll_interval
+
+    def Get_rank(self):
+        return self.rank
+
+    def Get_size(self):
+        return self.size
+
+    def send(self, obj, dest, tag=0):
+        self._inboxes[dest].put((self.rank, tag, obj))
+
+    def recv(self, source=ANY_SOURCE, tag=ANY_TAG, status=None):
+        def matches(message):
+            return source in (ANY_SOURCE, message[0]) and tag in (ANY_TAG, message[1])
+
+        for i, message in enumerate(self._pending):
+            if matches(message):
+                del self._pending[i]
+                break
+        else:
+            while True:
+                message = self._get(source)
+                if matches(message):
+                    break
+                self._pending.append(message)
+        if status is not None:
+            status.source, status.tag = message[0], message[1]
+        return message[2]
+
+    def _get(self, source):
+        inbox = self._inboxes[self.rank]
+        if not self._processes:
+            return inbox.get()
+        while True:
+            try:
+                return inbox.get(timeout=self._poll_interval)
+            except queue.Empty:
+                pass
+            dead = [(rank, process.exitcode) for rank, process in self._processes.items()
+                    if process.exitcode is not None and (process.exitcode != 0 or rank == source)]
+            if dead:
+                # A rank may have sent its last message just before exiting
+                try:
+                    return inbox.get(timeout=self._poll_interval)
+                except queue.Empty:
+                    rank, exitcode = dead[0]
+                    raise RuntimeError(f"Rank {rank} exited with code {exitcode} while rank {self.rank} was waiting")
+
+    def bcast(self, obj, root=0):
+        if self.rank == root:
+            for dest in range(self.size):
+                if dest != root:
+                    self.send(obj, dest, _TAG_COLLECTIVE)
+            return obj
+        return self.recv(root, _TAG_COLLECTIVE)
+
+    def gather(self, obj, root=0):
+        if self.rank != root:
+            self.send(obj, root, _TAG_COLLECTIVE)
+            return None
+        return [obj if source == root else self.recv(source, _TAG_COLLECTIVE) for source in range(self.size)]
+
+    def reduce(self, obj, op=operator.add, root=0):
+        values = self.gather(obj, root)
+        if values is None:
+            return None
+        result = values[0]
+        for value in values[1:]:
+            result = op(result, value)
+        return result
+
+    def allreduce(self, obj, op=operator.add):
+        return self.bcast(self.reduce(obj, op), 0)
+
+    def barrier(self):
+        self.allreduce(0)
+
+def get_comm():
+    """Return MPI.COMM_WORLD if mpi4py is available, otherwise a single-rank LocalComm."""
+    if MPI is not None:
+        return MPI.COMM_WORLD
+    return LocalComm(0, [multiprocessing.Queue()])
+
+def _status(comm):
+    return LocalStatus() if isinstance(comm, LocalComm) else MPI.Status()
+
+def _sum_op(comm):
+    return operator.add if isinstance(comm, LocalComm) else MPI.SUM
+
+def _rank_main(target, comm, args):
+    try:
+        target(comm, *args)
+    except ScheduleAborted:
+        # Rank 0 re-raises the original error
+        pass
+
+def run_local(target, nranks, *args, shutdown_timeout=5.0):
+    """
+    Run target(comm, *args) on nranks local processes connected by LocalComm.
+
+    Rank 0 runs in the calling process; ranks 1..nranks-1 are child processes. Rank 0
+    raises RuntimeError instead of hanging if a child dies while it waits on a
+    message. If rank 0 raises, children still running after shutdown_timeout
+    seconds are terminated.
+
+    :return: The return value of rank 0.
+    """
+    inboxes = [multiprocessing.Queue() for _ in range(nranks)]
+    processes = [multiprocessing.Process(target=_rank_main, args=(target, LocalComm(rank, inboxes), args))
+                 for rank in range(1, nranks)]
+    for process in processes:
+        process.start()
+    try:
+        result = target(LocalComm(0, inboxes, dict(enumerate(processes, start=1))), *args)
+    except BaseException:
+        for process in processes:
+            process.join(shutdown_timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        raise
+    for process in processes:
+        process.join()
+    failed = [rank for rank, process in enumerate(processes, start=1) if process.exitcode != 0]
+    if failed:
+        raise RuntimeError(f"Ranks {failed} exited with an error")
+    return result
+
+def _slice(params, start, end):
+    return {name: values[start:end] for name, values in params.items()}
+
+def _portable(error):
+    """Return error if it survives pickling, otherwise a RuntimeError describing it."""
+    try:
+        return pickle.loads(pickle.dumps(error))
+    except Exception:
+        return RuntimeError(repr(error))
+
+def _schedule(comm, params, chunk_size, compute, collect):
+    """
+    Hand out chunks of params dynamically from rank 0 and run compute on them.
+
+    compute(chunk) runs on the rank holding the chunk; collect(start, end, result)
+    runs on rank 0 with whatever compute returned. With a single rank, rank 0
+    computes every chunk itself.
+
+    If compute raises on a worker, the exception and its traceback are sent to rank 0
+    under TAG_ERROR. Rank 0 then hands out no more chunks, waits for the chunks
+    already out, stops every worker and re-raises the first error; the workers
+    raise ScheduleAborted. Workers are only stopped once every chunk is back, so
+    no worker moves on to a collective while rank 0 is still receiving results.
+    """
+    rank, size = comm.Get_rank(), comm.Get_size()
+    if rank != 0:
+        status = _status(comm)
+        while True:
+            message = comm.recv(source=0, tag=ANY_TAG, status=status)
+            if status.Get_tag() == TAG_STOP:
+                if message is not None:
+                    raise ScheduleAborted(message)
+                return
+            start, end, chunk = message
+            try:
+                result = compute(chunk)
+            except Exception as error:
+                comm.send((start, end, _portable(error), traceback.format_exc()), dest=0, tag=TAG_ERROR)
+            else:
+                comm.send((start, end, result), dest=0, tag=TAG_RESULT)
+
+    n = len(next(iter(params.values())))
+    chunks = [(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+    if size == 1:
+        for start, end in chunks:
+            collect(start, end, compute(_slice(params, start, end)))
+        return
+
+    next_chunk = 0
+    active = 0
+    idle = []
+    failure = None
+
+    def dispatch(worker):
+        nonlocal next_chunk, active
+        if failure is None and next_chunk < len(chunks):
+            start, end = chunks[next_chunk]
+            comm.send((start, end, _slice(params, start, end)), dest=worker, tag=TAG_WORK)
+            next_chunk += 1
+            active += 1
+        else:
+            idle.append(worker)
+
+    for worker in range(1, size):
+        dispatch(worker)
+
+    status = _status(comm)
+    while active:
+        message = comm.recv(source=ANY_SOURCE, tag=ANY_TAG, status=status)
+        worker = status.Get_source()
+        active -= 1
+        if status.Get_tag() == TAG_ERROR:
+            if failure is None:
+                failure = (worker,) + tuple(message)
+        elif failure is None:
+            collect(*message)
+        dispatch(worker)
+
+    reason = None
+    if failure is not None:
+        worker, start, end, error, remote_traceback = failure
+        reason = f"Rank {worker} failed on items {start}:{end}"
+    for worker in idle:
+        comm.send(reason, dest=worker, tag=TAG_STOP)
+    if failure is not None:
+        raise error from RuntimeError(f"{reason}\n\n{remote_traceback}")
+
+def distributed_evaluate(comm, params, chunk_size=4096):
+    """
+    Evaluate a particle population across all ranks.
+
+    :param comm: Communicator (MPI.COMM_WORLD or LocalComm).
+    :param params: Population dict (see population_params); only needed on rank 0.
+    :param chunk_size: Particles per work unit.
+    :return: On rank 0, dict of output arrays as from evaluate_batch; None elsewhere.
+    """
+    outputs = {}
+
+    def collect(start, end, result):
+        for field, values in result.items():
+            if field not in outputs:
+                outputs[field] = np.empty(len(params['d_p']))
+            outputs[field][start:end] = values
+
+    _schedule(comm, params, chunk_size, evaluate_batch, collect)
+    return outputs if comm.Get_rank() == 0 else None
+
+def distributed_histograms(comm, params, bins, chunk_size=4096):
+    """
+    Histogram population outputs across all ranks without collecting per-particle results.
+
+    Each rank accumulates histograms of its own chunks; the counts are then
+    combined with a collective sum reduction onto rank 0.
+
+    :param comm: Communicator (MPI.COMM_WORLD or LocalComm).
+    :param params: Population dict (see population_params); only needed on rank 0.
+    :param bins: Dict of output field -> bin edges, e.g. {'landing_range': edges}.
+    :param chunk_size: Particles per work unit.
+    :return: On rank 0, dict of output field -> counts; None elsewhere.
+    """
+    bins = {field: np.asarray(edges, dtype=float) for field, edges in comm.bcast(bins, root=0).items()}
+    counts = {field: np.zeros(len(edges) - 1, dtype=np.int64) for field, edges in bins.items()}
+
+    def compute(chunk):
+        results = evaluate_batch(chunk)
+        for field, edges in bins.items():
+            counts[field] += np.histogram(results[field], bins=edges)[0]
+
+    def collect(start, end, result):
+        pass
+
+    _schedule(comm, params, chunk_size, compute, collect)
+
+    # Reduce all histograms as one flat array, then split it back per field
+    total = comm.reduce(np.concatenate(list(counts.values())), op=_sum_op(comm), root=0)
+    if total is None:
+        return None
+    splits = np.cumsum([len(c) for c in counts.values()])[:-1]
+    return dict(zip(counts, np.split(total, splits)))
+
+def distributed_morris(comm, problem, param_values, output='landing_range', chunk_size=4096,
+                       num_resamples=100, conf_level=0.95):
+    """
+    Run a Morris sensitivity study with the model evaluations spread across ranks.
+
+    :param comm: Communicator (MPI.COMM_WORLD or LocalComm).
+    :param problem: SALib problem dict whose 'names' are evaluate_batch parameters.
+    :param param_values: Morris sample matrix; only needed on rank 0.
+    :param output: evaluate_batch output field to analyze.
+    :return: On rank 0, the SALib Morris result; None elsewhere.
+    """
+    params = None
+    if comm.Get_rank() == 0:
+        params = population_params(len(param_values), **dict(zip(problem['names'], np.asarray(param_values).T)))
+    outputs = distributed_evaluate(comm, params, chunk_size)
+    if comm.Get_rank() != 0:
+        return None
+
+    # SALib is only needed on rank 0, and only here
+    from SALib.analyze.morris import analyze
+    return analyze(problem, np.asarray(param_values), outputs[output],
+                   num_resamples=num_resamples, conf_level=conf_level)
+
+def _histogram_run(comm, samples, seed, num_bins):
+    """Monte Carlo landing-range histogram for random lunar ejecta (command-line driver)."""
+    params = None
+    if comm.Get_rank() == 0:
+        rng = np.random.default_rng(seed)
+        params = population_params(d_p=10**rng.uniform(-6, -4, samples), u_g=rng.uniform(100, 2000, samples),
+                                   r=rng.uniform(0, 10, samples))
+    edges = np.linspace(0, 1e4, num_bins + 1)
+    counts = distributed_histograms(comm, params, {'landing_range': edges})
+    if comm.Get_rank() == 0:
+        for low, high, count in zip(edges[:-1], edges[1:], counts['landing_range']):
+            print(f"{low:10.1f} - {high:10.1f} m: {count}")
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed Monte Carlo ejecta landing-range histogram.")
+    parser.add_argument('--samples', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--bins', type=int, default=20)
+    parser.add_argument('--local-ranks', type=int, help="Run this many local ranks instead of using MPI")
+    args = parser.parse_args()
+    if args.local_ranks:
+        run_local(_histogram_run, args.local_ranks, args.samples, args.seed, args.bins)
+    else:
+        _histogram_run(get_comm(), args.samples, args.seed, args.bins)
+
+if __name__ == "__main__":
+    main()
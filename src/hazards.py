@@ -0,0 +1,255 @@
+import numpy as np
+
+class Box:
+    """Axis-aligned box obstacle, e.g. an instrument or lander body."""
+
+    def __init__(self, name, x_range, y_range, z_range):
+        """
+        :param name: Structure name used in the report.
+        :param x_range: (min, max) along the x axis (m).
+        :param y_range: (min, max) along the y axis (m).
+        :param z_range: (min, max) height above the surface (m).
+        """
+        self.name = name
+        self.lower = np.array([x_range[0], y_range[0], z_range[0]], dtype=float)
+        self.upper = np.array([x_range[1], y_range[1], z_range[1]], dtype=float)
+
+    def bounds_xy(self):
+        return self.lower[0], self.upper[0], self.lower[1], self.upper[1]
+
+    def entry(self, start, direction):
+        """
+        Slab test for segments start + t * direction, 0 <= t <= 1.
+
+        :return: Tuple (t_enter, t_exit) per segment; the segment hits the box where t_enter <= t_exit.
+        """
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (self.lower - start) / direction
+            t_high = (self.upper - start) / direction
+        t_near = np.where(direction == 0, np.where((start >= self.lower) & (start <= self.upper), -np.inf, np.inf),
+                          np.minimum(t_low, t_high))
+        t_far = np.where(direction == 0, np.where((start >= self.lower) & (start <= self.upper), np.inf, -np.inf),
+                         np.maximum(t_low, t_high))
+        return np.maximum(t_near.max(axis=1), 0.0), np.minimum(t_far.min(axis=1), 1.0)
+
+class Cylinder:
+    """Vertical cylinder obstacle, e.g. a second lander or a mast."""
+
+    def __init__(self, name, center, radius, z_range):
+        """
+        :param name: Structure name used in the report.
+        :param center: (x, y) of the cylinder axis (m).
+        :param radius: Cylinder radius (m).
+        :param z_range: (min, max) height above the surface (m).
+        """
+        self.name = name
+        self.center = np.asarray(center, dtype=float)
+        self.radius = float(radius)
+        self.z_range = (float(z_range[0]), float(z_range[1]))
+
+    def bounds_xy(self):
+        (x, y), r = self.center, self.radius
+        return x - r, x + r, y - r, y + r
+
+    def entry(self, start, direction):
+        """
+        Intersect segments start + t * direction, 0 <= t <= 1, with the cylinder.
+
+        :return: Tuple (t_enter, t_exit) per segment; the segment hits the cylinder where t_enter <= t_exit.
+        """
+        # Radial interval: roots of |p_xy + t d_xy - c|^2 = r^2
+        p = start[:, :2] - self.center
+        d = direction[:, :2]
+        a = (d**2).sum(axis=1)
+        b = 2 * (p * d).sum(axis=1)
+        c = (p**2).sum(axis=1) - self.radius**2
+        disc = b**2 - 4 * a * c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            root = np.sqrt(np.maximum(disc, 0))
+            t_in = np.where(a > 0, (-b - root) / (2 * a), np.where(c <= 0, -np.inf, np.inf))
+            t_out = np.where(a > 0, (-b + root) / (2 * a), np.where(c <= 0, np.inf, -np.inf))
+        t_in = np.where((a > 0) & (disc < 0), np.inf, t_in)
+
+        # Height interval, as in the box slab test
+        z, dz = start[:, 2], direction[:, 2]
+        z_low, z_high = self.z_range
+        inside = (z >= z_low) & (z <= z_high)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (z_low - z) / dz
+            t_high = (z_high - z) / dz
+        tz_in = np.where(dz == 0, np.where(inside, -np.inf, np.inf), np.minimum(t_low, t_high))
+        tz_out = np.where(dz == 0, np.where(inside, np.inf, -np.inf), np.maximum(t_low, t_high))
+
+        return np.maximum(np.maximum(t_in, tz_in), 0.0), np.minimum(np.minimum(t_out, tz_out), 1.0)
+
+class UniformGrid:
+    """Uniform horizontal grid mapping cells to the structures whose footprint overlaps them."""
+
+    def __init__(self, structures, cell_size):
+        self.cell_size = cell_size
+        bounds = np.array([structure.bounds_xy() for structure in structures])
+        self.ix_min = int(np.floor(bounds[:, 0].min() / cell_size))
+        self.iy_min = int(np.floor(bounds[:, 2].min() / cell_size))
+        self.nx = int(np.floor(bounds[:, 1].max() / cell_size)) - self.ix_min + 1
+        self.ny = int(np.floor(bounds[:, 3].max() / cell_size)) - self.iy_min + 1
+
+        keys, ids = [], []
+        for i, (x0, x1, y0, y1) in enumerate(bounds):
+            ix = np.arange(int(np.floor(x0 / cell_size)), int(np.floor(x1 / cell_size)) + 1)
+            iy = np.arange(int(np.floor(y0 / cell_size)), int(np.floor(y1 / cell_size)) + 1)
+            cells = self.key(*np.meshgrid(ix, iy, indexing='ij')).ravel()
+            keys.append(cells)
+            ids.append(np.full(cells.size, i))
+        keys, ids = np.concatenate(keys), np.concatenate(ids)
+        order = np.argsort(keys, kind='stable')
+        self.keys, self.ids = keys[order], ids[order]
+
+    def clip(self, start, direction):
+        """
+        Parameter range of segments start + t * direction (xy only) inside the grid extent.
+
+        :return: Tuple (t_enter, t_exit) per segment, within [0, 1]; empty where t_enter > t_exit.
+        """
+        lower = np.array([self.ix_min, self.iy_min]) * self.cell_size
+        upper = lower + np.array([self.nx, self.ny]) * self.cell_size
+        inside = (start >= lower) & (start <= upper)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_low = (lower - start) / direction
+            t_high = (upper - start) / direction
+        t_near = np.where(direction == 0, np.where(inside, -np.inf, np.inf), np.minimum(t_low, t_high))
+        t_far = np.where(direction == 0, np.where(inside, np.inf, -np.inf), np.maximum(t_low, t_high))
+        return np.maximum(t_near.max(axis=1), 0.0), np.minimum(t_far.min(axis=1), 1.0)
+
+    def key(self, ix, iy):
+        """Linear cell key, or -1 for cells outside the grid."""
+        ix, iy = ix - self.ix_min, iy - self.iy_min
+        valid = (ix >= 0) & (ix < self.nx) & (iy >= 0) & (iy < self.ny)
+        return np.where(valid, ix.astype(np.int64) * self.ny + iy, -1)
+
+    def candidates(self, lower, upper):
+        """
+        Return candidate (segment, structure) pairs for segment xy bounding boxes.
+
+        Segments must be no longer than one cell in x and y, so each touches at most 2 x 2 cells.
+        """
+        ix0, iy0 = np.floor(lower / self.cell_size).astype(np.int64).T
+        ix1, iy1 = np.floor(upper / self.cell_size).astype(np.int64).T
+        segments, structures = [], []
+        for ix, use_x in ((ix0, True), (ix1, ix1 != ix0)):
+            for iy, use_y in ((iy0, True), (iy1, iy1 != iy0)):
+                cells = np.where(use_x & use_y, self.key(ix, iy), -1)
+                begin = np.searchsorted(self.keys, cells, side='left')
+                end = np.searchsorted(self.keys, cells, side='right')
+                counts = np.where(cells >= 0, end - begin, 0)
+                segment = np.repeat(np.arange(len(cells)), counts)
+                offset = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+                segments.append(segment)
+                structures.append(self.ids[np.repeat(begin, counts) + offset])
+        pairs = np.unique(np.column_stack([np.concatenate(segments), np.concatenate(structures)]), axis=0)
+        return pairs[:, 0], pairs[:, 1]
+
+def find_impacts(trajectories, structures, azimuths=None, masses=None, time_step=None,
+                 horizontal_velocity=None, cell_size=None):
+    """
+    Find where a batch of trajectories first strikes any of a set of structures.
+
+    Each trajectory is a sequence of (horizontal distance, height) points in the
+    vertical plane along its launch azimuth, as returned by calculate_trajectory
+    or calculate_trajectory_lane2012, with the plume center at the origin. Segments
+    between consecutive points are tested against the structures through a
+    uniform grid, so only structures near each segment are checked. Segments are
+    clipped to the grid and split into pieces no longer than one cell, so the
+    cell size follows the structures rather than the trajectory step. A particle
+    stops at the first structure it hits.
+
+    :param trajectories: List of trajectories.
+    :param structures: List of Box and Cylinder obstacles.
+    :param azimuths: Launch azimuth of each trajectory in degrees from the x axis (default 0).
+    :param masses: Particle masses (kg); if omitted, energies are per unit mass.
+    :param time_step: Time between trajectory points (s), scalar or per trajectory,
+        as for calculate_trajectory.
+    :param horizontal_velocity: Constant horizontal velocity (m/s), scalar or per
+        trajectory, as v_0 for calculate_trajectory_lane2012. Used when time_step is None.
+    :param cell_size: Grid cell size (m); defaults to a quarter of the median structure footprint.
+    :return: List with one dict per structure: 'name', 'count', 'particles' (trajectory
+        indices), 'locations' (k, 3) impact points and 'energies' (J, or J/kg).
+    """
+    n = len(trajectories)
+    azimuths = np.radians(np.broadcast_to(0.0 if azimuths is None else azimuths, (n,)))
+    masses = np.broadcast_to(1.0 if masses is None else masses, (n,)).astype(float)
+    if time_step is None and horizontal_velocity is None:
+        raise ValueError("Either time_step or horizontal_velocity is required to compute impact energies")
+
+    # Flatten all trajectory segments into one batch
+    points = [np.asarray(trajectory, dtype=float).reshape(-1, 2) for trajectory in trajectories]
+    lengths = np.array([max(len(p) - 1, 0) for p in points])
+    owner = np.repeat(np.arange(n), lengths)
+    order = np.concatenate([np.arange(length) for length in lengths]) if lengths.sum() else np.array([], dtype=int)
+    starts = np.concatenate([p[:-1] for p in points if len(p) > 1] or [np.empty((0, 2))])
+    ends = np.concatenate([p[1:] for p in points if len(p) > 1] or [np.empty((0, 2))])
+
+    cos, sin = np.cos(azimuths[owner]), np.sin(azimuths[owner])
+    start = np.column_stack([starts[:, 0] * cos, starts[:, 0] * sin, starts[:, 1]])
+    direction = np.column_stack([ends[:, 0] * cos, ends[:, 0] * sin, ends[:, 1]]) - start
+
+    if time_step is not None:
+        dt = np.broadcast_to(time_step, (n,)).astype(float)[owner]
+    else:
+        dt = np.abs(ends[:, 0] - starts[:, 0]) / np.broadcast_to(horizontal_velocity, (n,)).astype(float)[owner]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        velocity = direction / dt[:, None]
+
+    report = [{'name': s.name, 'count': 0, 'particles': np.array([], dtype=int),
+               'locations': np.empty((0, 3)), 'energies': np.array([])} for s in structures]
+    if len(start) == 0 or not structures:
+        return report
+
+    if cell_size is None:
+        extent = np.array([[x1 - x0, y1 - y0] for x0, x1, y0, y1 in (s.bounds_xy() for s in structures)])
+        cell_size = max(np.median(extent) / 4, 1e-9)
+    grid = UniformGrid(structures, cell_size)
+
+    # Split the part of each segment inside the grid into pieces spanning at most one cell
+    t_enter, t_exit = grid.clip(start[:, :2], direction[:, :2])
+    span = np.maximum(t_exit - t_enter, 0.0)
+    length = np.abs(direction[:, :2]).max(axis=1) * span
+    pieces = np.where(t_enter <= t_exit, np.maximum(np.ceil(length / cell_size * (1 + 1e-9)), 1), 0).astype(np.int64)
+    parent = np.repeat(np.arange(len(start)), pieces)
+    k = np.arange(pieces.sum()) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+    t_low = t_enter[parent] + span[parent] * k / pieces[parent]
+    t_high = t_enter[parent] + span[parent] * (k + 1) / pieces[parent]
+    piece_start = start[parent, :2] + t_low[:, None] * direction[parent, :2]
+    piece_end = start[parent, :2] + t_high[:, None] * direction[parent, :2]
+    piece, structure = grid.candidates(np.minimum(piece_start, piece_end), np.maximum(piece_start, piece_end))
+
+    # Pieces of one segment often share a structure; test each (segment, structure) pair once
+    if piece.size:
+        pairs = np.unique(np.column_stack([parent[piece], structure]), axis=0)
+        segment, structure = pairs[:, 0], pairs[:, 1]
+    else:
+        segment = structure = np.array([], dtype=np.int64)
+
+    # Exact intersection tests for the candidate pairs, one vectorized call per structure
+    t_hit = np.full(len(segment), np.inf)
+    for i, obstacle in enumerate(structures):
+        mask = structure == i
+        if mask.any():
+            t_enter, t_exit = obstacle.entry(start[segment[mask]], direction[segment[mask]])
+            t_hit[mask] = np.where(t_enter <= t_exit, t_enter, np.inf)
+    hit = np.isfinite(t_hit)
+    segment, structure, t_hit = segment[hit], structure[hit], t_hit[hit]
+
+    # First impact per particle: earliest segment, then earliest point along it
+    particle = owner[segment]
+    first = np.lexsort((t_hit, order[segment], particle))
+    keep = np.ones(len(first), dtype=bool)
+    keep[1:] = particle[first][1:] != particle[first][:-1]
+    first = first[keep]
+    segment, structure, t_hit, particle = segment[first], structure[first], t_hit[first], particle[first]
+
+    locations = start[segment] + t_hit[:, None] * direction[segment]
+    energies = 0.5 * masses[particle] * (velocity[segment]**2).sum(axis=1)
+    for i, entry in enumerate(report):
+        mask = structure == i
+        entry.update(count=int(mask.sum()), particles=particle[mask], locations=locations[mask], energies=energies[mask])
+    return report
@@ -1,8 +1,15 @@
+import sys
 from src.input_utils import get_input, load_input_from_file, validate_input
 from src.ballistics import calculate_initial_velocity, calculate_trajectory, calculate_launch_angle
 from src.output_utils import plot_trajectory, save_trajectory_to_file
 
-def main():
+def main(plot=True):
+    """Run a single trajectory calculation.
+
+    :param plot: Show the trajectory plot. Pass False (or ``--no-plot`` on the
+        command line) for compute-only batch runs, which then never import
+        matplotlib.
+    """
     # Step 1: Load or get input data
     try:
         data = load_input_from_file("data/input.json")
@@ -38,8 +45,9 @@ def main():
     )
     
     # Step 3: Output results
-    plot_trajectory(trajectory)
+    if plot:
+        plot_trajectory(trajectory)
     save_trajectory_to_file(trajectory, "results/trajectory.txt")
 
 if __name__ == "__main__":
-    main()
+    main(plot="--no-plot" not in sys.argv[1:])
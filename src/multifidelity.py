@@ -0,0 +1,228 @@
+import numpy as np
+
+from src.ballistics import (REGOLITH_DENSITY, calculate_initial_velocity, calculate_launch_angles,
+                            kinematic_landing, lane2012_gradients)
+
+# Tiers in order of increasing cost and fidelity
+TIERS = ['kinematic', 'lane2012', 'integrated']
+
+# Per-particle parameters and their defaults (see src/main.py and tests/test_moat.py)
+DEFAULTS = {
+    'g': 1.62,
+    'C_d': 0.5,
+    'rho_g': 0.01,
+    'r': 2.0,
+    'x_0': 0.01,
+    's_0': 0.1,
+    'b': 0.05,
+    'stagnation_velocity': 200,
+    'max_distance': 10,
+    'time_step': 0.01,
+}
+
+def _launch(params):
+    """
+    Initial velocity and launch angle shared by all tiers.
+
+    Particles are lofted only if drag overcomes gravity (v_0 > 0) and they sit inside
+    the impingement zone (positive launch angle); the rest stay where they are.
+    """
+    v_0 = calculate_initial_velocity(params['C_d'], params['rho_g'], params['d_p'], params['u_g'],
+                                     params['g'], params['time_step'])
+    launch_angle = calculate_launch_angles(params['u_g'], params['stagnation_velocity'], params['r'],
+                                           params['max_distance'])
+    lofted = (v_0 > 0) & (launch_angle > 0)
+    return v_0, launch_angle, lofted
+
+def drag_time(params):
+    """Drag response time 1 / (K u_g) with K = 0.75 C_d rho_g / (rho_p d_p), in seconds."""
+    K = 0.75 * params['C_d'] * params['rho_g'] / (REGOLITH_DENSITY * params['d_p'])
+    return 1 / (K * np.abs(params['u_g']))
+
+def kinematic_tier(params):
+    """Drag-free ballistic flight, closed form (calculate_trajectory)."""
+    v_0, launch_angle, lofted = _launch(params)
+    distance, apex = kinematic_landing(np.where(lofted, v_0, 0.0), launch_angle, params['g'])
+    return {'landing_range': params['r'] + distance, 'apex': apex}
+
+def lane2012_tier(params):
+    """
+    Lane 2012 curve fit (calculate_trajectory_lane2012), launched at y_0 = r.
+
+    The fit is only as good as the per-particle s_0 and b in params; the DEFAULTS
+    are placeholders, so calibrate them first (see src/calibration.py).
+    """
+    result = lane2012_gradients(params['d_p'], params['u_g'], params['g'], params['C_d'], params['s_0'],
+                                params['b'], x_0=params['x_0'], y_0=params['r'], rho_g=params['rho_g'],
+                                time_step=params['time_step'])
+    lofted = _launch(params)[2]
+    return {'landing_range': np.where(lofted, result['landing_range'], params['r']),
+            'apex': np.where(lofted, result['apex'], params['x_0'])}
+
+def integrated_tier(params, layer_height=1.0, steps_per_flight=400, max_flights=4):
+    """
+    Numerically integrate flight with gas drag and gravity.
+
+    The particle starts on the surface at r with the tier-independent initial velocity and
+    launch angle. It feels drag K |u - v| (u - v) towards a horizontal gas flow
+    u_g exp(-z / layer_height), so drag fades away from the surface. Each particle
+    uses its own time step, a fraction 1/steps_per_flight of its drag-free flight
+    time, and integration stops after max_flights such flight times.
+    """
+    v_0, launch_angle, lofted = _launch(params)
+    K = 0.75 * params['C_d'] * params['rho_g'] / (REGOLITH_DENSITY * params['d_p'])
+    theta = np.radians(launch_angle)
+    speed = np.where(lofted, v_0, 0.0)
+
+    flight_time = np.maximum(2 * speed * np.sin(theta) / params['g'], 1e-9)
+    dt = flight_time / steps_per_flight
+    x = np.array(params['r'], dtype=float)
+    z = np.zeros_like(x)
+    vx, vz = speed * np.cos(theta), speed * np.sin(theta)
+    apex = z.copy()
+    landing = np.where(lofted, np.nan, params['r'])
+    flying = lofted.copy()
+
+    for _ in range(steps_per_flight * max_flights):
+        if not flying.any():
+            break
+        u = params['u_g'] * np.exp(-np.maximum(z, 0) / layer_height)
+        slip = np.hypot(u - vx, vz)
+        # Semi-implicit drag keeps the update stable when dt exceeds the drag time
+        damping = 1 + K * slip * dt
+        vx_new = (vx + K * slip * u * dt) / damping
+        vz_new = (vz - params['g'] * dt) / damping
+        x_new = x + vx_new * dt
+        z_new = z + vz_new * dt
+
+        hit = flying & (z_new < 0)
+        fraction = np.where(hit, z / np.where(hit, z - z_new, 1), 0)
+        landing = np.where(hit, x + fraction * (x_new - x), landing)
+        flying &= ~hit
+        x, z = np.where(flying, x_new, x), np.where(flying, z_new, z)
+        vx, vz = np.where(flying, vx_new, vx), np.where(flying, vz_new, vz)
+        apex = np.maximum(apex, np.where(flying, z, apex))
+
+    return {'landing_range': landing, 'apex': apex}
+
+TIER_MODELS = {'kinematic': kinematic_tier, 'lane2012': lane2012_tier, 'integrated': integrated_tier}
+
+def regime_selector(params, drag_negligible=0.05, drag_dominant=20.0, use_lane2012=False, lane2012_radius=None):
+    """
+    Pick a tier per particle from regime indicators.
+
+    The drag number is the drag-free flight time divided by the drag response time.
+    Below drag_negligible the gas barely acts during flight and the kinematic tier is
+    used, as it is for particles that are not lofted at all. Everything else is
+    integrated, unless use_lane2012 is set: then particles below drag_dominant that
+    are launched inside the Lane 2012 fit's validity radius use the Lane 2012 tier.
+
+    :param use_lane2012: Route to the Lane 2012 tier; only worthwhile when params carry
+        s_0 and b calibrated for the particles, since the DEFAULTS land far from the
+        integrated tier.
+    :param lane2012_radius: Largest launch radius covered by the Lane 2012 fit (m);
+        defaults to each particle's max_distance (the impingement radius).
+    :return: Array of tier indices into TIERS.
+    """
+    v_0, launch_angle, lofted = _launch(params)
+    flight_time = 2 * np.where(lofted, v_0, 0.0) * np.sin(np.radians(launch_angle)) / params['g']
+    drag_number = flight_time / drag_time(params)
+    radius = params['max_distance'] if lane2012_radius is None else lane2012_radius
+
+    tier = np.full(len(drag_number), TIERS.index('integrated'))
+    if use_lane2012:
+        tier[(drag_number <= drag_dominant) & (params['r'] > 0) & (params['r'] <= radius)] = TIERS.index('lane2012')
+    tier[drag_number < drag_negligible] = TIERS.index('kinematic')
+    return tier
+
+class MultiFidelityScheduler:
+    """
+    Route each particle through the cheapest adequate trajectory model.
+
+    Every batch is split by tier and each tier is evaluated as one vectorized call.
+    Every check_every batches, a random sample of each lower tier is also run through
+    the reference (highest) tier. The landing-range errors are accumulated per tier,
+    and if a sample's error exceeds max_error, that tier's particles in the batch are
+    escalated to the next tier. With the default check_every=1, every returned
+    result therefore comes from a tier whose sampled error in that batch was within
+    max_error.
+    """
+
+    def __init__(self, selector=regime_selector, check_fraction=0.02, check_every=1, max_error=1.0, seed=0):
+        """
+        :param selector: Function mapping a parameter dict to tier indices.
+        :param check_fraction: Fraction of each lower tier to cross-check (at least one particle).
+        :param check_every: Cross-check every this many batches.
+        :param max_error: Landing-range error (m) that triggers escalation; None only
+            records errors without gating results.
+        :param seed: Seed for choosing cross-check samples.
+        """
+        self.selector = selector
+        self.check_fraction = check_fraction
+        self.check_every = check_every
+        self.max_error = max_error
+        self.rng = np.random.default_rng(seed)
+        self.batches = 0
+        self.stats = {tier: {'particles': 0, 'checked': 0, 'max_error': 0.0, 'sum_squared_error': 0.0,
+                             'escalated': 0} for tier in TIERS}
+
+    def prepare(self, **columns):
+        """Broadcast per-particle columns ('d_p' and 'u_g' required) and fill the rest from DEFAULTS."""
+        names = ['d_p', 'u_g'] + list(DEFAULTS)
+        values = np.broadcast_arrays(*(np.asarray(columns.get(name, DEFAULTS.get(name)), dtype=float) for name in names))
+        return {name: np.array(value, ndmin=1) for name, value in zip(names, values)}
+
+    def run(self, params):
+        """
+        Evaluate one batch of particles.
+
+        :param params: Dict of equal-length arrays (see prepare).
+        :return: Dict with 'landing_range', 'apex' and 'tier' (index into TIERS) per particle.
+        """
+        self.batches += 1
+        tier = np.asarray(self.selector(params)).copy()
+        n = len(tier)
+        landing = np.full(n, np.nan)
+        apex = np.full(n, np.nan)
+        check = self.batches % self.check_every == 0
+        top = len(TIERS) - 1
+
+        for level, name in enumerate(TIERS):
+            members = np.nonzero(tier == level)[0]
+            if members.size == 0:
+                continue
+            result = TIER_MODELS[name](_take(params, members))
+
+            if check and level < top:
+                count = max(1, int(round(self.check_fraction * members.size)))
+                sample = self.rng.choice(members.size, size=min(count, members.size), replace=False)
+                reference = TIER_MODELS[TIERS[top]](_take(params, members[sample]))
+                error = np.abs(result['landing_range'][sample] - reference['landing_range'])
+                error = np.where(np.isfinite(error), error, np.inf)
+                stats = self.stats[name]
+                stats['checked'] += len(sample)
+                stats['max_error'] = max(stats['max_error'], float(error.max()))
+                stats['sum_squared_error'] += float((error**2).sum())
+                if self.max_error is not None and error.max() > self.max_error:
+                    # Hand the whole tier to the next one; it is evaluated later in this loop
+                    tier[members] = level + 1
+                    stats['escalated'] += members.size
+                    continue
+
+            self.stats[name]['particles'] += members.size
+            landing[members] = result['landing_range']
+            apex[members] = result['apex']
+
+        return {'landing_range': landing, 'apex': apex, 'tier': tier}
+
+    def error_bounds(self):
+        """Return per-tier cross-check statistics: sample count, max and RMS landing-range error."""
+        bounds = {}
+        for name, stats in self.stats.items():
+            if stats['checked']:
+                bounds[name] = {'checked': stats['checked'], 'max_error': stats['max_error'],
+                                'rms_error': (stats['sum_squared_error'] / stats['checked'])**0.5}
+        return bounds
+
+def _take(params, index):
+    return {name: values[index] for name, values in params.items()}
@@ -1,5 +1,3 @@
-import matplotlib.pyplot as plt
-
 def save_trajectory_to_file(trajectory, file_path):
     """Save trajectory data to a file."""
     with open(file_path, 'w') as f:
@@ -8,6 +6,10 @@ def save_trajectory_to_file(trajectory, file_path):
 
 def plot_trajectory(trajectory):
     """Plot the particle trajectory."""
+    # matplotlib is imported here rather than at module level so batch runs
+    # that never plot do not pay its import cost.
+    import matplotlib.pyplot as plt
+
     x, y = zip(*trajectory)
     plt.figure(figsize=(8, 5))
     plt.plot(x, y, marker="o", linestyle="-", color="b")
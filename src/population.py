@@ -0,0 +1,57 @@
+"""
+Vectorized evaluation of particle populations.
+
+Used by the trajectory service and the distributed drivers. A population is a
+dict of equal-length 1-D arrays keyed by PARAMETERS, and evaluate_batch maps it
+to a dict of arrays keyed by FIELDS.
+"""
+import numpy as np
+
+from src.ballistics import calculate_initial_velocity, calculate_launch_angles, kinematic_landing
+
+# Parameter defaults, matching src/main.py
+DEFAULTS = {
+    'C_d': 0.5,
+    'rho_g': 0.01,
+    'g': 1.62,
+    'r': 2,
+    'max_distance': 10,
+    'stagnation_velocity': 200,
+    'time_step': 0.01,
+}
+REQUIRED = ['d_p', 'u_g']
+PARAMETERS = REQUIRED + list(DEFAULTS)
+
+# Output columns
+FIELDS = ['v_0', 'launch_angle', 'landing_range', 'apex']
+
+def evaluate_batch(params):
+    """
+    Evaluate landing range and apex for arrays of particles.
+
+    :param params: Dict of equal-length 1-D arrays keyed by PARAMETERS.
+    :return: Dict of arrays keyed by FIELDS.
+    """
+    v_0 = calculate_initial_velocity(params['C_d'], params['rho_g'], params['d_p'], params['u_g'],
+                                     params['g'], params['time_step'])
+    launch_angle = calculate_launch_angles(params['u_g'], params['stagnation_velocity'],
+                                           params['r'], params['max_distance'])
+    landing_distance, apex = kinematic_landing(v_0, launch_angle, params['g'])
+    return {
+        'v_0': v_0,
+        'launch_angle': launch_angle,
+        'landing_range': params['r'] + landing_distance,
+        'apex': apex,
+    }
+
+def population_params(n=None, **columns):
+    """
+    Build a population parameter dict for evaluate_batch, filling unset parameters from DEFAULTS.
+
+    :param n: Population size; defaults to the broadcast length of the columns.
+    :param columns: Parameter name -> scalar or array; 'd_p' and 'u_g' are required.
+    :return: Dict of equal-length float arrays keyed by PARAMETERS.
+    """
+    values = [np.asarray(columns.get(name, DEFAULTS.get(name)), dtype=float) for name in PARAMETERS]
+    shape = np.broadcast_shapes(*(value.shape for value in values)) if n is None else (n,)
+    return {name: np.array(np.broadcast_to(value, shape), ndmin=1) for name, value in zip(PARAMETERS, values)}
@@ -0,0 +1,236 @@
+import json
+import os
+
+import numpy as np
+
+MANIFEST = 'manifest.jsonl'
+
+class ResultStoreWriter:
+    """
+    Write sweep or population outputs to a chunked columnar store.
+
+    A store is a directory with one subdirectory per chunk holding one .npy file
+    per column, plus a manifest recording each chunk's row count and per-column
+    min/max. The manifest is JSON lines: a header with the column names, then one
+    line per chunk. For every index column, a chunk also stores the column's values in
+    sorted order with the matching row permutation, so range conditions on it
+    become two binary searches. Usable as a context manager.
+
+    A chunk's manifest line is appended only after its files are written, so if a
+    campaign dies the store still opens with every complete chunk; only rows still
+    buffered (fewer than chunk_size) are lost.
+    """
+
+    def __init__(self, path, columns, index_columns=(), chunk_size=65536):
+        """
+        :param path: Store directory; created if missing.
+        :param columns: Column names, e.g. inputs plus 'v_0', 'launch_angle', 'landing_range', 'apex'.
+        :param index_columns: Columns to build sorted indexes for, e.g. ('d_p', 'r').
+        :param chunk_size: Rows per chunk; bounds the memory used by queries.
+        """
+        for name in index_columns:
+            if name not in columns:
+                raise ValueError(f"Index column {name} is not a column")
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.columns = list(columns)
+        self.index_columns = list(index_columns)
+        self.chunk_size = chunk_size
+        self.chunks = []
+        self._buffer = {name: [] for name in self.columns}
+        self._buffered = 0
+        self._manifest = open(os.path.join(path, MANIFEST), 'w')
+        self._write_manifest_line({'columns': self.columns, 'index_columns': self.index_columns})
+
+    def append(self, rows):
+        """
+        Append rows given as a dict of equal-length arrays keyed by column name.
+
+        Extra keys are ignored, so outputs of evaluate_batch can be merged with their inputs directly.
+        """
+        missing = [name for name in self.columns if name not in rows]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        # Copy, so later changes to the caller's arrays cannot alter buffered rows
+        arrays = {name: np.array(rows[name], dtype=float, ndmin=1) for name in self.columns}
+        length = len(arrays[self.columns[0]])
+        if any(len(values) != length for values in arrays.values()):
+            raise ValueError("All columns must have the same length")
+        # Buffer chunk-sized slices, so a large append costs time linear in its size
+        offset = 0
+        while offset < length:
+            take = min(self.chunk_size - self._buffered, length - offset)
+            for name, values in arrays.items():
+                self._buffer[name].append(values[offset:offset + take])
+            self._buffered += take
+            offset += take
+            if self._buffered == self.chunk_size:
+                self._flush()
+
+    def _flush(self):
+        data = {name: np.concatenate(parts) for name, parts in self._buffer.items()}
+        size = self._buffered
+        self._buffer = {name: [] for name in self.columns}
+        self._buffered = 0
+
+        name = f'chunk_{len(self.chunks):05d}'
+        directory = os.path.join(self.path, name)
+        os.makedirs(directory, exist_ok=True)
+        stats = {}
+        for column in self.columns:
+            values = data[column]
+            np.save(os.path.join(directory, column + '.npy'), values)
+            finite = values[np.isfinite(values)]
+            stats[column] = [float(finite.min()), float(finite.max())] if finite.size else [None, None]
+            if column in self.index_columns:
+                order = np.argsort(values, kind='stable')
+                np.save(os.path.join(directory, column + '.order.npy'), order)
+                np.save(os.path.join(directory, column + '.sorted.npy'), values[order])
+        chunk = {'name': name, 'rows': size, 'stats': stats}
+        self.chunks.append(chunk)
+        self._write_manifest_line(chunk)
+
+    def _write_manifest_line(self, entry):
+        self._manifest.write(json.dumps(entry) + '\n')
+        self._manifest.flush()
+
+    def close(self):
+        """Write the last partial chunk and close the manifest."""
+        if self._manifest.closed:
+            return
+        if self._buffered:
+            self._flush()
+        self._manifest.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ResultStore:
+    """
+    Query a store written by ResultStoreWriter.
+
+    Conditions are inclusive (low, high) ranges per column, with None for an open
+    side. Chunks whose min/max statistics cannot satisfy a condition are skipped
+    without being opened. In the remaining chunks, one indexed condition selects
+    candidate rows by binary search, and the other conditions and requested columns
+    are read for those rows only from memory-mapped files.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, MANIFEST)) as f:
+            lines = f.read().split('\n')
+        header = json.loads(lines[0])
+        self.columns = header['columns']
+        self.index_columns = header['index_columns']
+        self.chunks = []
+        for line in lines[1:]:
+            try:
+                self.chunks.append(json.loads(line))
+            except ValueError:
+                # End of file, or a line cut short by a crash while it was written
+                break
+        self.last_scan = {'chunks': 0, 'skipped': 0, 'rows_read': 0}
+
+    def __len__(self):
+        return sum(chunk['rows'] for chunk in self.chunks)
+
+    def _load(self, chunk, name):
+        return np.load(os.path.join(self.path, chunk['name'], name + '.npy'), mmap_mode='r')
+
+    def _may_match(self, chunk, where):
+        for column, (low, high) in where.items():
+            chunk_low, chunk_high = chunk['stats'][column]
+            if chunk_low is None:
+                return False
+            if (low is not None and chunk_high < low) or (high is not None and chunk_low > high):
+                return False
+        return True
+
+    def _rows(self, chunk, where):
+        """Row numbers within a chunk that satisfy all conditions."""
+        indexed = [column for column in where if column in self.index_columns]
+        if indexed:
+            column = indexed[0]
+            low, high = where[column]
+            sorted_values = self._load(chunk, column + '.sorted')
+            start = 0 if low is None else np.searchsorted(sorted_values, low, side='left')
+            end = len(sorted_values) if high is None else np.searchsorted(sorted_values, high, side='right')
+            rows = np.sort(self._load(chunk, column + '.order')[start:end])
+        else:
+            column = None
+            rows = np.arange(chunk['rows'])
+
+        for other, (low, high) in where.items():
+            if other == column or rows.size == 0:
+                continue
+            values = self._load(chunk, other)[rows]
+            keep = np.ones(rows.size, dtype=bool)
+            if low is not None:
+                keep &= values >= low
+            if high is not None:
+                keep &= values <= high
+            rows = rows[keep]
+        return rows
+
+    def iter_query(self, where=None, columns=None):
+        """
+        Yield matching rows chunk by chunk, as dicts of arrays.
+
+        :param where: Dict of column -> (low, high).
+        :param columns: Columns to return; defaults to all.
+        """
+        where = where or {}
+        columns = self.columns if columns is None else columns
+        for name in list(where) + list(columns):
+            if name not in self.columns:
+                raise ValueError(f"Unknown column: {name}")
+        self.last_scan = {'chunks': len(self.chunks), 'skipped': 0, 'rows_read': 0}
+        for chunk in self.chunks:
+            if not self._may_match(chunk, where):
+                self.last_scan['skipped'] += 1
+                continue
+            rows = self._rows(chunk, where)
+            self.last_scan['rows_read'] += rows.size
+            if rows.size:
+                yield {name: np.asarray(self._load(chunk, name)[rows]) for name in columns}
+
+    def query(self, where=None, columns=None):
+        """Return all matching rows as one dict of arrays."""
+        columns = self.columns if columns is None else columns
+        parts = list(self.iter_query(where, columns))
+        return {name: np.concatenate([part[name] for part in parts]) if parts else np.array([]) for name in columns}
+
+    def count(self, where=None):
+        """Number of rows matching the conditions."""
+        return sum(len(part[self.columns[0]]) for part in self.iter_query(where, self.columns[:1]))
+
+    def histogram(self, column, bins, where=None):
+        """
+        Histogram a column over matching rows, one chunk at a time.
+
+        :param bins: Bin edges.
+        :return: Tuple (counts, bin_edges) as from numpy.histogram.
+        """
+        edges = np.asarray(bins, dtype=float)
+        if edges.ndim != 1 or len(edges) < 2:
+            raise ValueError("bins must be an array of bin edges")
+        counts = np.zeros(len(edges) - 1, dtype=np.int64)
+        for part in self.iter_query(where, [column]):
+            counts += np.histogram(part[column], bins=edges)[0]
+        return counts, edges
+
+    def describe(self, column, where=None):
+        """Count, mean, min and max of a column over matching rows, one chunk at a time."""
+        count, total = 0, 0.0
+        low, high = np.inf, -np.inf
+        for part in self.iter_query(where, [column]):
+            values = part[column]
+            count += values.size
+            total += values.sum()
+            low, high = min(low, values.min()), max(high, values.max())
+        return {'count': count, 'mean': total / count if count else np.nan,
+                'min': low if count else np.nan, 'max': high if count else np.nan}
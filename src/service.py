@@ -0,0 +1,238 @@
+"""
+Local asyncio trajectory service.
+
+Keeps the ballistics engine warm in one process and answers landing-range queries
+over TCP (localhost by default) or a Unix socket. The protocol is one JSON object
+per line. Each request carries an 'id' and particle parameters; scalars and
+equal-length lists are broadcast against each other:
+
+    {"id": 1, "d_p": [1e-6, 1e-5], "u_g": 1000, "r": 2}
+
+Optional fields and their defaults are listed in DEFAULTS. Set "format": "binary"
+to receive a JSON header line followed by the raw little-endian float64 bytes of
+an (n, 4) array with columns FIELDS, instead of JSON lists.
+
+Non-finite outputs (e.g. for d_p = 0) are sent as null in JSON responses and as
+NaN in binary ones. Malformed requests, and request lines longer than
+max_request_bytes, are answered with {"id": ..., "error": "..."}.
+
+Concurrent requests are coalesced into one vectorized evaluation when they arrive
+within batch_window seconds of each other. The pending queue is bounded, so a
+flood of requests makes clients wait instead of growing memory.
+"""
+import argparse
+import asyncio
+import json
+
+import numpy as np
+
+from src.population import DEFAULTS, FIELDS, PARAMETERS, REQUIRED, evaluate_batch
+
+def parse_request(request):
+    """
+    Validate a request and broadcast its parameters to 1-D float arrays.
+
+    :raises ValueError: If a required field is missing, a value is not numeric or shapes do not broadcast.
+    """
+    for field in REQUIRED:
+        if field not in request:
+            raise ValueError(f"Missing required input: {field}")
+    values = []
+    for name in PARAMETERS:
+        try:
+            values.append(np.atleast_1d(np.asarray(request.get(name, DEFAULTS.get(name)), dtype=float)))
+        except (TypeError, ValueError):
+            raise ValueError(f"Parameter {name} must be a number or a list of numbers")
+    try:
+        values = np.broadcast_arrays(*values)
+    except ValueError:
+        raise ValueError("Particle parameters must be scalars or lists of equal length")
+    if values[0].ndim != 1:
+        raise ValueError("Particle parameters must be scalars or 1-D lists")
+    return dict(zip(PARAMETERS, values))
+
+class TrajectoryService:
+    """Micro-batching front end for evaluate_batch."""
+
+    def __init__(self, batch_window=0.002, max_batch=65536, max_pending=1024, max_request_bytes=32 * 2**20):
+        """
+        :param batch_window: Seconds to wait for more requests after the first one of a batch.
+        :param max_batch: Maximum number of particles per vectorized evaluation.
+        :param max_pending: Maximum number of queued requests before submitters wait.
+        :param max_request_bytes: Longest accepted request line; the default fits a
+            max_batch-particle request with every parameter given as a list.
+        """
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.max_request_bytes = max_request_bytes
+        self.stats = {'requests': 0, 'batches': 0}
+        self._queue = None
+        self._worker = None
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, params):
+        """
+        Queue parsed parameters for the next batch and wait for the result.
+
+        :param params: Output of parse_request.
+        :return: Dict of arrays keyed by FIELDS.
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((params, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            size = len(batch[0][0]['d_p'])
+            deadline = loop.time() + self.batch_window
+            while size < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item[0]['d_p'])
+            self._evaluate(batch)
+
+    def _evaluate(self, batch):
+        self.stats['requests'] += len(batch)
+        self.stats['batches'] += 1
+        sizes = [len(params['d_p']) for params, _ in batch]
+        combined = {name: np.concatenate([params[name] for params, _ in batch]) for name in PARAMETERS}
+        try:
+            # Non-finite outputs are reported as null, not as warnings
+            with np.errstate(divide='ignore', invalid='ignore'):
+                results = evaluate_batch(combined)
+        except Exception as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        offsets = np.cumsum([0] + sizes)
+        for (_, future), start, end in zip(batch, offsets[:-1], offsets[1:]):
+            if not future.done():
+                future.set_result({field: results[field][start:end] for field in FIELDS})
+
+    async def handle_client(self, reader, writer):
+        """Serve one connection; responses may be returned out of request order."""
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def reply(payload):
+            async with lock:
+                writer.writelines(payload)
+                await writer.drain()
+
+        async def respond(request):
+            request_id = request.get('id') if isinstance(request, dict) else None
+            try:
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                result = await self.submit(parse_request(request))
+            except Exception as error:
+                payload = [_error_line(request_id, error)]
+            else:
+                if request.get('format') == 'binary':
+                    data = np.column_stack([result[field] for field in FIELDS]).astype('<f8').tobytes()
+                    header = {'id': request_id, 'fields': FIELDS, 'shape': [len(result['v_0']), len(FIELDS)],
+                              'dtype': '<f8', 'nbytes': len(data)}
+                    payload = [json.dumps(header).encode() + b'\n', data]
+                else:
+                    # Strict JSON has no NaN or Infinity
+                    response = {field: np.where(np.isfinite(result[field]), result[field], None).tolist()
+                                for field in FIELDS}
+                    response['id'] = request_id
+                    payload = [json.dumps(response, allow_nan=False).encode() + b'\n']
+            await reply(payload)
+
+        def schedule(coroutine):
+            task = asyncio.create_task(coroutine)
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.IncompleteReadError as error:
+                    line = error.partial
+                    if not line:
+                        break
+                except asyncio.LimitOverrunError:
+                    if not await _discard_line(reader):
+                        break
+                    error = ValueError(f"Request exceeds {self.max_request_bytes} bytes")
+                    schedule(reply([_error_line(None, error)]))
+                    continue
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                schedule(respond(request))
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+def _error_line(request_id, error):
+    return json.dumps({'id': request_id, 'error': str(error)}).encode() + b'\n'
+
+async def _discard_line(reader):
+    """Skip the rest of an over-long line; return False if the stream ends first."""
+    while True:
+        try:
+            await reader.readuntil(b'\n')
+            return True
+        except asyncio.LimitOverrunError as error:
+            await reader.readexactly(error.consumed)
+        except asyncio.IncompleteReadError:
+            return False
+
+async def start_server(service, host='127.0.0.1', port=0, path=None):
+    """
+    Start the service and listen on TCP host:port, or on a Unix socket if path is given.
+
+    :return: The asyncio server.
+    """
+    await service.start()
+    if path is not None:
+        return await asyncio.start_unix_server(service.handle_client, path=path, limit=service.max_request_bytes)
+    return await asyncio.start_server(service.handle_client, host=host, port=port, limit=service.max_request_bytes)
+
+async def serve(host='127.0.0.1', port=8765, path=None, batch_window=0.002):
+    service = TrajectoryService(batch_window=batch_window)
+    server = await start_server(service, host, port, path)
+    async with server:
+        await server.serve_forever()
+
+def main():
+    parser = argparse.ArgumentParser(description="Local trajectory service.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument('--batch-window', type=float, default=0.002, help="Batching window in seconds")
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port, args.unix, args.batch_window))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from src.ballistics import lane2012_height, kinematic_landing
+
+# Column order of the Lane 2012 input array
+LANE2012_INPUTS = ['x_0', 'y_0', 's_0', 'b', 'g', 'v_0']
+
+class SharedArray:
+    """A NumPy array backed by a multiprocessing.shared_memory block."""
+
+    def __init__(self, shape, dtype=float, name=None):
+        """
+        Create a new block, or attach to an existing one if name is given.
+
+        :param shape: Array shape.
+        :param dtype: Array dtype.
+        :param name: Name of an existing shared memory block.
+        """
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        nbytes = max(1, int(np.prod(self.shape)) * self.dtype.itemsize)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            # Workers share the parent's resource tracker, so attaching here does
+            # not make the block outlive or get unlinked before the parent.
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    def spec(self):
+        """Return what a worker needs to attach: (name, shape, dtype)."""
+        return self.shm.name, self.shape, self.dtype.str
+
+    def close(self):
+        self.array = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+class SharedResult:
+    """
+    Result arrays living in shared memory.
+
+    The arrays are views into the shared blocks; copy anything needed beyond
+    close(). Usable as a context manager.
+    """
+
+    def __init__(self, blocks):
+        self._blocks = blocks
+        for key, block in blocks.items():
+            setattr(self, key, block.array)
+
+    def close(self):
+        """Release and unlink the shared memory blocks."""
+        for key, block in self._blocks.items():
+            setattr(self, key, None)
+            block.close()
+            block.unlink()
+        self._blocks = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Shared blocks and their arrays attached in each worker process, keyed like the parent's blocks.
+# The blocks are kept referenced so their memory stays mapped for the life of the worker.
+_worker_blocks = {}
+_worker_arrays = {}
+
+def _attach(specs):
+    """Worker initializer: attach to the parent's shared memory blocks once per process."""
+    for key, (name, shape, dtype) in specs.items():
+        _worker_blocks[key] = SharedArray(shape, dtype, name=name)
+        _worker_arrays[key] = _worker_blocks[key].array
+
+def _lane2012_chunk(start, end, step_size):
+    """Evaluate Lane 2012 trajectories for rows start:end and write them in place."""
+    inputs = _worker_arrays['inputs'][start:end]
+    trajectories = _worker_arrays['trajectories'][start:end]
+    x_0, y_0, s_0, b, g, v_0 = (inputs[:, [i]] for i in range(len(LANE2012_INPUTS)))
+
+    # Same sampling as calculate_trajectory_lane2012: y = y_0 + k * step_size
+    y = y_0 + step_size * np.arange(trajectories.shape[1])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x = lane2012_height(y, x_0, y_0, s_0, b, g, v_0)
+
+    below = x < 0
+    landed = below.any(axis=1)
+    lengths = np.where(landed, below.argmax(axis=1), trajectories.shape[1])
+    trajectories[:] = np.where(np.arange(trajectories.shape[1]) < lengths[:, None], x, np.nan)
+    _worker_arrays['lengths'][start:end] = lengths
+
+    # Landing point: linear interpolation between the last point above and first below the surface
+    rows = np.nonzero(landed & (lengths > 0))[0]
+    landing = np.full(end - start, np.nan)
+    above = x[rows, lengths[rows] - 1]
+    under = x[rows, lengths[rows]]
+    landing[rows] = y[rows, lengths[rows] - 1] + step_size * above / (above - under)
+    _worker_arrays['landing'][start:end] = landing
+
+def _kinematic_chunk(start, end):
+    """Evaluate closed-form kinematic landing distance and apex for rows start:end."""
+    v_0, launch_angle, gravity = _worker_arrays['inputs'][start:end].T
+    landing, apex = kinematic_landing(v_0, launch_angle, gravity)
+    _worker_arrays['landing'][start:end] = landing
+    _worker_arrays['apex'][start:end] = apex
+
+def _run_chunks(blocks, task, args, n, max_workers, chunk_size):
+    """Fan row chunks of task out to a process pool sharing the given blocks."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(1, -(-n // (4 * max_workers)))
+    starts = list(range(0, n, chunk_size))
+    ends = [min(start + chunk_size, n) for start in starts]
+    specs = {key: block.spec() for key, block in blocks.items()}
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_attach, initargs=(specs,)) as executor:
+        # Workers return nothing; results are written straight into shared memory
+        for _ in executor.map(task, starts, ends, *([arg] * len(starts) for arg in args)):
+            pass
+
+def lane2012_population(inputs, step_size=100, max_points=1000, max_workers=None, chunk_size=None):
+    """
+    Compute Lane 2012 trajectories for many particles in worker processes.
+
+    Trajectories are sampled like calculate_trajectory_lane2012. The parent
+    allocates the output in shared memory and workers write into it directly,
+    so no result data is pickled.
+
+    :param inputs: Array of shape (n, 6) with columns LANE2012_INPUTS.
+    :param step_size: Horizontal sampling step (m).
+    :param max_points: Maximum number of points stored per trajectory.
+    :param max_workers: Number of worker processes.
+    :param chunk_size: Particles per task.
+    :return: SharedResult with 'landing' (n,) landing positions (NaN if the particle
+        has not landed within max_points), 'trajectories' (n, max_points) heights
+        padded with NaN, and 'lengths' (n,) number of valid points.
+    """
+    inputs = np.asarray(inputs, dtype=float)
+    n = len(inputs)
+    blocks = {
+        'inputs': SharedArray(inputs.shape),
+        'landing': SharedArray((n,)),
+        'trajectories': SharedArray((n, max_points)),
+        'lengths': SharedArray((n,), dtype=np.int64),
+    }
+    blocks['inputs'].array[:] = inputs
+    try:
+        _run_chunks(blocks, _lane2012_chunk, [step_size], n, max_workers, chunk_size)
+    except BaseException:
+        SharedResult(blocks).close()
+        raise
+    return SharedResult(blocks)
+
+def kinematic_population(v_0, launch_angle, gravity, max_workers=None, chunk_size=None):
+    """
+    Compute kinematic landing distance and apex for many particles in worker processes.
+
+    :param v_0: Initial velocities (m/s).
+    :param launch_angle: Launch angles in degrees.
+    :param gravity: Gravitational acceleration(s) (m/s^2).
+    :return: SharedResult with 'landing' and 'apex' arrays relative to the launch point.
+    """
+    inputs = np.column_stack(np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in (v_0, launch_angle, gravity))))
+    n = len(inputs)
+    blocks = {
+        'inputs': SharedArray(inputs.shape),
+        'landing': SharedArray((n,)),
+        'apex': SharedArray((n,)),
+    }
+    blocks['inputs'].array[:] = inputs
+    try:
+        _run_chunks(blocks, _kinematic_chunk, [], n, max_workers, chunk_size)
+    except BaseException:
+        SharedResult(blocks).close()
+        raise
+    return SharedResult(blocks)
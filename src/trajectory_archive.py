@@ -0,0 +1,140 @@
+import bisect
+import os
+
+import numpy as np
+
+COORDS_SUFFIX = '.coords'
+INDEX_SUFFIX = '.index.npy'
+
+class TrajectoryArchiveWriter:
+    """
+    Write trajectories to a memory-mappable archive.
+
+    An archive is two files: '<path>.coords', the (x, y) points of every trajectory
+    back to back as raw float64, and '<path>.index.npy', a structured array with one
+    row per trajectory holding its particle id, offset and length in points, and
+    the input parameters it was computed from. Index rows are sorted by particle id
+    when the archive is closed. Usable as a context manager.
+    """
+
+    def __init__(self, path, param_names=()):
+        """
+        :param path: Archive path without suffix.
+        :param param_names: Names of the input parameters stored with each trajectory.
+        """
+        self.path = path
+        self.param_names = list(param_names)
+        self._coords = open(path + COORDS_SUFFIX, 'wb')
+        self._rows = []
+        self._ids = set()
+        self._offset = 0
+
+    def add(self, particle_id, trajectory, params=None):
+        """
+        Append one trajectory.
+
+        :param particle_id: Integer id, unique within the archive.
+        :param trajectory: Sequence of (x, y) points, as returned by calculate_trajectory.
+        :param params: Dict of input parameter values keyed by param_names.
+        """
+        if particle_id in self._ids:
+            raise ValueError(f"Duplicate particle id: {particle_id}")
+        params = params or {}
+        missing = [name for name in self.param_names if name not in params]
+        if missing:
+            raise ValueError(f"Missing parameters for particle {particle_id}: {missing}")
+
+        points = np.asarray(trajectory, dtype='<f8').reshape(-1, 2)
+        self._coords.write(points.tobytes())
+        self._rows.append((particle_id, self._offset, len(points)) + tuple(params[name] for name in self.param_names))
+        self._ids.add(particle_id)
+        self._offset += len(points)
+
+    def close(self):
+        """Flush the coordinates and write the index."""
+        if self._coords.closed:
+            return
+        self._coords.close()
+        dtype = [('particle_id', '<i8'), ('offset', '<i8'), ('length', '<i8')] + [(name, '<f8') for name in self.param_names]
+        np.save(self.path + INDEX_SUFFIX, np.sort(np.array(self._rows, dtype=dtype), order='particle_id'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class TrajectoryArchive:
+    """
+    Random-access reader for an archive written by TrajectoryArchiveWriter.
+
+    Coordinates and the index are both memory-mapped, so opening an archive costs
+    O(1) and reading a single trajectory O(log N) (a binary search over the sorted
+    particle ids) regardless of archive size; only pages that are touched are read
+    from disk.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: Archive path without suffix.
+        """
+        self.path = path
+        self.index = np.load(path + INDEX_SUFFIX, mmap_mode='r')
+        if os.path.getsize(path + COORDS_SUFFIX) == 0:
+            self.coords = np.empty((0, 2))
+        else:
+            self.coords = np.memmap(path + COORDS_SUFFIX, dtype='<f8', mode='r').reshape(-1, 2)
+        self.param_names = list(self.index.dtype.names[3:])
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, particle_id):
+        return self._row(particle_id) is not None
+
+    def _row(self, particle_id):
+        """Index row of a particle id, or None; bisect reads only O(log N) ids from the map."""
+        ids = self.index['particle_id']
+        row = bisect.bisect_left(ids, particle_id)
+        return row if row < len(ids) and ids[row] == particle_id else None
+
+    def _entry(self, particle_id):
+        row = self._row(particle_id)
+        if row is None:
+            raise KeyError(particle_id)
+        return self.index[row]
+
+    def ids(self):
+        """Return the particle ids in the archive, in ascending order."""
+        return self.index['particle_id']
+
+    def params(self, particle_id):
+        """Return the input parameters of a particle as a dict."""
+        entry = self._entry(particle_id)
+        return {name: float(entry[name]) for name in self.param_names}
+
+    def get(self, particle_id):
+        """
+        Return the trajectory of a particle as a read-only (n, 2) view of the archive.
+
+        :raises KeyError: If the particle id is not in the archive.
+        """
+        entry = self._entry(particle_id)
+        return self.coords[entry['offset']:entry['offset'] + entry['length']]
+
+    def select(self, **bounds):
+        """
+        Return the ids of particles whose parameters lie within the given bounds.
+
+        :param bounds: Parameter name -> (low, high) inclusive range; None leaves a side open.
+        :return: Array of particle ids.
+        """
+        mask = np.ones(len(self.index), dtype=bool)
+        for name, (low, high) in bounds.items():
+            if name not in self.param_names:
+                raise ValueError(f"Unknown parameter: {name}")
+            if low is not None:
+                mask &= self.index[name] >= low
+            if high is not None:
+                mask &= self.index[name] <= high
+        return self.index['particle_id'][mask]
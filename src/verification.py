@@ -0,0 +1,166 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from src.ballistics import lane2012_height
+
+# Lane 2012 curve fits for a 1 micron particle (x_0 = launch height, y_0 = launch radius)
+REFERENCE_CASES = {
+    'C1': {'x_0': 0.01, 'y_0': 0.88779, 'D': 1e-6, 'b': 4.361, 's_0': 0.03662, 'v_0': 1983},
+    'C2': {'x_0': 0.01, 'y_0': 2.4428, 'D': 1e-6, 'b': 11.09, 's_0': 0.03389, 'v_0': 528.7},
+    'C3': {'x_0': 0.01, 'y_0': 6.7215, 'D': 1e-6, 'b': 59.28, 's_0': 0.1089, 'v_0': 191},
+}
+
+LUNAR_GRAVITY = 1.62  # m/s^2
+
+def load_reference_curve(file_path):
+    """
+    Load a digitized reference curve from a CSV file with an 'x, y' header.
+
+    Curves are parsed once per file and cached; the file is re-read only if it
+    changes on disk. The returned arrays are sorted by x and read-only.
+
+    :param file_path: Path to the CSV file.
+    :return: Tuple (x, y) of NumPy arrays.
+    """
+    file_path = os.path.abspath(file_path)
+    return _load_reference_curve(file_path, os.path.getmtime(file_path))
+
+@lru_cache(maxsize=None)
+def _load_reference_curve(file_path, mtime):
+    data = np.loadtxt(file_path, delimiter=',', skiprows=1, ndmin=2)
+    order = np.argsort(data[:, 0])
+    x = np.ascontiguousarray(data[order, 0])
+    y = np.ascontiguousarray(data[order, 1])
+    x.setflags(write=False)
+    y.setflags(write=False)
+    return x, y
+
+def interpolate_loglog(x_model, y_model, x_ref):
+    """
+    Interpolate model output onto reference abscissae in log-log space.
+
+    Points with non-positive coordinates are dropped from the model curve, and
+    reference abscissae outside the model range map to NaN.
+
+    :param x_model: Model horizontal positions.
+    :param y_model: Model vertical positions.
+    :param x_ref: Reference horizontal positions.
+    :return: Array of model heights at x_ref.
+    """
+    x_model = np.asarray(x_model, dtype=float)
+    y_model = np.asarray(y_model, dtype=float)
+    x_ref = np.asarray(x_ref, dtype=float)
+
+    valid = (x_model > 0) & (y_model > 0)
+    if valid.sum() < 2:
+        return np.full(x_ref.shape, np.nan)
+    log_x = np.log(x_model[valid])
+    log_y = np.log(y_model[valid])
+    order = np.argsort(log_x)
+    log_x, log_y = log_x[order], log_y[order]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        log_x_ref = np.log(x_ref)
+    result = np.exp(np.interp(log_x_ref, log_x, log_y, left=np.nan, right=np.nan))
+    result[~np.isfinite(log_x_ref)] = np.nan
+    return result
+
+def error_metrics(y_model, y_ref):
+    """
+    Compare model and reference heights in log10 space.
+
+    :param y_model: Model heights at the reference abscissae (NaN where undefined).
+    :param y_ref: Reference heights.
+    :return: Dict with 'rms' and 'max' log10 error, 'n_points' and 'n_valid'.
+    """
+    y_model = np.asarray(y_model, dtype=float)
+    y_ref = np.asarray(y_ref, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        error = np.log10(y_model) - np.log10(y_ref)
+    error = error[np.isfinite(error)]
+    if error.size == 0:
+        return {'rms': np.nan, 'max': np.nan, 'n_points': y_ref.size, 'n_valid': 0}
+    return {
+        'rms': float(np.sqrt(np.mean(error**2))),
+        'max': float(np.max(np.abs(error))),
+        'n_points': int(y_ref.size),
+        'n_valid': int(error.size),
+    }
+
+def model_curve(case, g=LUNAR_GRAVITY, x_max=None, num_points=512):
+    """
+    Evaluate the Lane 2012 trajectory for a reference case on a log-spaced grid.
+
+    :param case: Dict with 'x_0', 'y_0', 's_0', 'b' and 'v_0'.
+    :param g: Gravitational acceleration (m/s^2).
+    :param x_max: Largest horizontal position to evaluate (m); defaults to 100 y_0.
+    :param num_points: Number of grid points.
+    :return: Tuple (x, y) of NumPy arrays, truncated where the particle lands.
+    """
+    y_0 = case['y_0']
+    if x_max is None:
+        x_max = 100 * y_0
+    x = np.geomspace(y_0, max(x_max, y_0 * (1 + 1e-9)), num_points)
+    y = lane2012_height(x, case['x_0'], y_0, case['s_0'], case['b'], g, case['v_0'])
+    landed = np.nonzero(y <= 0)[0]
+    if landed.size:
+        x, y = x[:landed[0]], y[:landed[0]]
+    return x, y
+
+def verify_case(case, reference_file, g=LUNAR_GRAVITY):
+    """
+    Verify one Lane 2012 case against its digitized reference curve.
+
+    :param case: Dict with 'x_0', 'y_0', 's_0', 'b' and 'v_0'.
+    :param reference_file: Path to the reference CSV file.
+    :param g: Gravitational acceleration (m/s^2).
+    :return: Dict of error metrics (see error_metrics).
+    """
+    return compare_curve(case, *load_reference_curve(reference_file), g)
+
+def compare_curve(case, x_ref, y_ref, g=LUNAR_GRAVITY):
+    """
+    Compare one Lane 2012 case against reference arrays already in memory.
+
+    :param case: Dict with 'x_0', 'y_0', 's_0', 'b' and 'v_0'.
+    :param x_ref: Reference horizontal positions, sorted.
+    :param y_ref: Reference vertical positions.
+    :param g: Gravitational acceleration (m/s^2).
+    :return: Dict of error metrics (see error_metrics).
+    """
+    x_model, y_model = model_curve(case, g, x_max=x_ref[-1])
+    return error_metrics(interpolate_loglog(x_model, y_model, x_ref), y_ref)
+
+def _verify_item(item):
+    """Process-pool entry point: unpack (name, case, x_ref, y_ref, g)."""
+    name, case, x_ref, y_ref, g = item
+    return name, compare_curve(case, x_ref, y_ref, g)
+
+def verify_cases(cases=None, reference_dir='.', g=LUNAR_GRAVITY, max_workers=None):
+    """
+    Verify many reference cases, in parallel across processes.
+
+    Each case is compared against '<reference_dir>/<name>.csv', or against the
+    path in its optional 'file' entry. Curves are loaded through the cache in this
+    process and shipped to the workers as arrays, so workers never parse CSV files.
+
+    :param cases: Dict of case name -> case parameters; defaults to REFERENCE_CASES.
+    :param reference_dir: Directory holding the reference CSV files.
+    :param g: Gravitational acceleration (m/s^2).
+    :param max_workers: Number of worker processes; 1 runs serially in-process.
+    :return: Dict of case name -> error metrics.
+    """
+    if cases is None:
+        cases = REFERENCE_CASES
+    items = [(name, case, *load_reference_curve(case.get('file', os.path.join(reference_dir, name + '.csv'))), g)
+             for name, case in cases.items()]
+
+    if max_workers == 1 or len(items) <= 1:
+        return dict(map(_verify_item, items))
+
+    chunksize = max(1, len(items) // (4 * (max_workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(executor.map(_verify_item, items, chunksize=chunksize))
@@ -0,0 +1,70 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import numpy as np
+from src.adaptive_sweep import AdaptiveSweep, adaptive_landing_sweep
+from src.ballistics import lane2012_gradients
+
+class TestAdaptiveSweep(unittest.TestCase):
+
+    def test_refines_only_near_sharp_change(self):
+        """A 2-D step response is resolved at the step with far fewer points than a dense grid."""
+        calls = []
+
+        def model(points):
+            calls.append(len(points))
+            return np.where(points[:, 0] + points[:, 1] > 1.0, 10.0, 0.0)
+
+        sweep = AdaptiveSweep(model, [(0, 1), (0, 1)], initial_points=5, tolerance=1.0, max_depth=5)
+        points, values = sweep.run()
+        dense = (4 * 2**5 + 1)**2
+        self.assertLess(len(points), dense / 4)
+        self.assertEqual(len(calls), sweep.waves)
+
+        # Every leaf cell is either flat or at the finest resolution, next to the step
+        lower, upper = sweep.leaf_cells()
+        finest = np.isclose(upper[:, 0] - lower[:, 0], 0.25 / 2**5)
+        for low, high, fine in zip(lower, upper, finest):
+            corners = model(np.array([[low[0], low[1]], [high[0], high[1]], [low[0], high[1]], [high[0], low[1]]]))
+            self.assertTrue(fine or np.ptp(corners) <= 1.0)
+
+    def test_landing_range_sweep(self):
+        """Sweeping gas velocity meets the tolerance between neighbouring points, using fewer calls than a dense grid."""
+        fixed = {'d_p': 5e-5, 'g': 1.62, 'C_d': 0.5, 's_0': 0.1, 'b': 0.05}
+        sweep = adaptive_landing_sweep({'u_g': (100, 600)}, fixed, tolerance=5.0, initial_points=5, max_depth=8)
+        points, values = sweep.points()
+        self.assertLess(len(points), 4 * 2**8 + 1)
+        expected = lane2012_gradients(u_g=points[:, 0], **fixed)['landing_range']
+        np.testing.assert_allclose(values, expected)
+        self.assertTrue(np.all(np.abs(np.diff(values)) <= 5.0))
+
+    def test_budget_is_a_hard_cap(self):
+        """max_evaluations bounds the total number of model evaluations, spent on the largest spreads first."""
+        model = lambda p: np.sin(6 * p[:, 0]) * np.cos(6 * p[:, 1])
+        for budget in [25, 60, 100, 250]:
+            sweep = AdaptiveSweep(model, [(0, 2), (0, 2)], initial_points=5, tolerance=0.01, max_evaluations=budget)
+            points, _ = sweep.run()
+            self.assertLessEqual(len(points), budget)
+        self.assertGreater(len(points), 200)
+        with self.assertRaises(ValueError):
+            AdaptiveSweep(model, [(0, 2), (0, 2)], initial_points=5, max_evaluations=24)
+
+    def test_not_lofted_region_is_flat(self):
+        """Cells that are entirely NaN are left coarse; cells at the NaN boundary are refined."""
+        model = lambda p: np.where(p[:, 0] < 0.3, np.nan, p[:, 0])
+        sweep = AdaptiveSweep(model, [(0, 1)], initial_points=5, tolerance=1.0, max_depth=4)
+        points, values = sweep.run()
+        lower, upper = sweep.leaf_cells()
+        self.assertTrue(np.isclose(upper - lower, 0.25).any())
+        self.assertTrue(np.isclose(upper - lower, 0.25 / 2**4).any())
+
+    def test_log_scale(self):
+        """Log-scaled dimensions place the coarse grid geometrically."""
+        sweep = AdaptiveSweep(lambda p: p[:, 0], [(1e-6, 1e-4)], initial_points=3, tolerance=np.inf, log_scale=[True])
+        points, _ = sweep.run()
+        np.testing.assert_allclose(points[:, 0], [1e-6, 1e-5, 1e-4])
+
+if __name__ == '__main__':
+    unittest.main()
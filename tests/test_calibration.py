@@ -0,0 +1,49 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+import numpy as np
+from src.calibration import calibrate_curves, calibrate_reference_cases
+from src.verification import REFERENCE_CASES, model_curve
+
+class TestCalibration(unittest.TestCase):
+
+    def test_recovers_reference_parameters(self):
+        """Fitting curves generated from the C1/C2/C3 parameters recovers those parameters."""
+        cases = list(REFERENCE_CASES.values())
+        curves = [model_curve(case, x_max=30, num_points=60) for case in cases]
+        fits = calibrate_curves(curves, [c['x_0'] for c in cases], [c['y_0'] for c in cases])
+        for case, fit in zip(cases, fits):
+            for name in ['b', 's_0', 'v_0']:
+                self.assertAlmostEqual(fit[name] / case[name], 1.0, places=5)
+            self.assertLess(fit['rms'], 1e-8)
+
+    def test_noisy_curve(self):
+        """With 1% multiplicative noise the fit is at least as good as the true parameters."""
+        case = REFERENCE_CASES['C2']
+        x, y = model_curve(case, x_max=30, num_points=80)
+        y = y * (1 + 0.01 * np.random.default_rng(4).standard_normal(len(y)))
+        fit = calibrate_curves([(x, y)], case['x_0'], case['y_0'])[0]
+        _, y_true = model_curve(case, x_max=30, num_points=80)
+        true_rms = np.sqrt(np.mean(((y_true - y) / y)**2))
+        self.assertLessEqual(fit['rms'], true_rms * (1 + 1e-9))
+        self.assertLess(fit['rms'], 0.02)
+
+    def test_reference_library_in_parallel(self):
+        """A library of reference files is fitted in batches across worker processes."""
+        with tempfile.TemporaryDirectory() as reference_dir:
+            for name, case in REFERENCE_CASES.items():
+                x, y = model_curve(case, x_max=30, num_points=40)
+                with open(os.path.join(reference_dir, name + '.csv'), 'w') as f:
+                    f.write("x, y\n")
+                    for point in zip(x, y):
+                        f.write(f"{point[0]}, {point[1]}\n")
+            fits = calibrate_reference_cases(reference_dir=reference_dir, max_workers=2, batch_size=1)
+        self.assertEqual(set(fits), set(REFERENCE_CASES))
+        for name, fit in fits.items():
+            self.assertAlmostEqual(fit['b'] / REFERENCE_CASES[name]['b'], 1.0, places=5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import numpy as np
+from src.ballistics import calculate_initial_velocity, calculate_launch_angle
+from src.descent import DescentEngine
+from src.plume_model import estimate_gas_velocity
+
+class TestDescentEngine(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small ejecta population and engine parameters."""
+        self.d_p = np.array([1e-6, 5e-6, 10e-6, 50e-6])
+        self.r = np.array([0.5, 2.0, 8.0, 30.0])
+        self.nozzle_area = 0.5
+        self.exhaust_velocity = 3000
+        self.engine = DescentEngine(self.d_p, self.r, self.nozzle_area, self.exhaust_velocity)
+
+    def test_step_matches_scalar_functions(self):
+        """A single step agrees with calculate_initial_velocity and calculate_launch_angle."""
+        altitude, thrust = 4.0, 15000
+        result = self.engine.step(altitude, thrust)
+        u_g = estimate_gas_velocity(thrust, self.nozzle_area, altitude, self.exhaust_velocity)
+        radius = 5.0 * altitude
+        for i in range(len(self.d_p)):
+            v_0 = calculate_initial_velocity(0.5, 0.01, self.d_p[i], u_g, 1.62, 0.01)
+            self.assertAlmostEqual(result['v_0'][i] / v_0, 1.0, places=9)
+            if self.r[i] < radius:
+                angle = calculate_launch_angle(u_g, 200, self.r[i], radius)
+                self.assertAlmostEqual(result['launch_angle'][i], angle, places=9)
+        self.assertFalse(result['lofted'][3])  # Outside the impingement radius
+        np.testing.assert_array_equal(result['landing_range'][~result['lofted']], self.r[~result['lofted']])
+
+    def test_reuses_work_between_close_steps(self):
+        """Only the parts that changed are recomputed along a descent."""
+        profile = [(10.0, 15000), (10.0, 15000), (10.001, 15000), (8.0, 15000), (8.0, 12000)]
+        results = self.engine.run(profile)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(self.engine.stats['gas_velocity'], 2)
+        self.assertEqual(self.engine.stats['initial_velocity'], 2)
+        self.assertEqual(self.engine.stats['launch_angle'], 3)
+        self.assertIs(results[0]['landing_range'], results[2]['landing_range'])
+
+        fresh = DescentEngine(self.d_p, self.r, self.nozzle_area, self.exhaust_velocity).step(8.0, 12000)
+        np.testing.assert_allclose(results[-1]['landing_range'], fresh['landing_range'])
+
+    def test_reused_steps_report_requested_conditions(self):
+        """A step within rtol is flagged as reused but reports its own gas velocity and radius."""
+        first, second = self.engine.run([(10.0, 15000), (10.001, 15000)])
+        self.assertFalse(first['reused'])
+        self.assertTrue(second['reused'])
+        self.assertEqual(second['impingement_radius'], 5.0 * 10.001)
+        self.assertEqual(second['gas_velocity'],
+                         estimate_gas_velocity(15000, self.nozzle_area, 10.001, self.exhaust_velocity))
+
+    def test_touchdown(self):
+        """At zero altitude nothing is lofted and no division by zero occurs."""
+        with np.errstate(all='raise'):
+            result = self.engine.step(0.0, 15000)
+        self.assertFalse(result['lofted'].any())
+        np.testing.assert_array_equal(result['landing_range'], self.r)
+        np.testing.assert_array_equal(result['apex'], 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import time
+import unittest
+import numpy as np
+from src.distributed import distributed_evaluate, distributed_histograms, get_comm, run_local
+from src.population import evaluate_batch, population_params
+
+EDGES = np.linspace(0, 5000, 11)
+
+def make_population():
+    """Random lunar ejecta population, identical on every call."""
+    rng = np.random.default_rng(1)
+    n = 5000
+    return population_params(d_p=10**rng.uniform(-6, -4, n), u_g=rng.uniform(100, 2000, n), r=rng.uniform(0, 10, n))
+
+def evaluate_run(comm):
+    params = make_population() if comm.Get_rank() == 0 else None
+    return distributed_evaluate(comm, params, chunk_size=300)
+
+def histogram_run(comm):
+    params = make_population() if comm.Get_rank() == 0 else None
+    return distributed_histograms(comm, params, {'landing_range': EDGES}, chunk_size=300)
+
+def misspelled_histogram_run(comm):
+    params = make_population() if comm.Get_rank() == 0 else None
+    return distributed_histograms(comm, params, {'landing_rnge': EDGES}, chunk_size=300)
+
+def crashing_run(comm):
+    if comm.Get_rank() == 1:
+        os._exit(3)
+    return comm.recv(source=1)
+
+def collective_run(comm):
+    total = comm.allreduce(comm.Get_rank() + 1)
+    ranks = comm.gather(comm.Get_rank())
+    return total, ranks
+
+class TestDistributed(unittest.TestCase):
+
+    def setUp(self):
+        self.expected = evaluate_batch(make_population())
+
+    def test_local_ranks_evaluate(self):
+        """Outputs computed on several local ranks match a single in-process evaluation."""
+        outputs = run_local(evaluate_run, 3)
+        for field, values in self.expected.items():
+            np.testing.assert_allclose(outputs[field], values)
+
+    def test_local_ranks_histogram(self):
+        """Histograms reduced across ranks equal the histogram of the whole population."""
+        counts = run_local(histogram_run, 4)
+        expected = np.histogram(self.expected['landing_range'], bins=EDGES)[0]
+        np.testing.assert_array_equal(counts['landing_range'], expected)
+        np.testing.assert_array_equal(histogram_run(get_comm())['landing_range'], expected)
+
+    def test_worker_error_is_raised_on_rank_0(self):
+        """An exception on a worker rank stops the run and is re-raised on rank 0."""
+        start = time.monotonic()
+        with self.assertRaises(KeyError) as context:
+            run_local(misspelled_histogram_run, 3)
+        self.assertIn('landing_rnge', str(context.exception.__cause__))
+        self.assertLess(time.monotonic() - start, 10)
+
+    def test_dead_rank_is_detected(self):
+        """Rank 0 raises instead of waiting forever on a rank that has died."""
+        with self.assertRaises(RuntimeError) as context:
+            run_local(crashing_run, 2)
+        self.assertIn('Rank 1 exited with code 3', str(context.exception))
+
+    def test_collectives(self):
+        """LocalComm collectives behave like their MPI counterparts."""
+        total, ranks = run_local(collective_run, 3)
+        self.assertEqual(total, 6)
+        self.assertEqual(ranks, [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import sys, os
+# Add the src folder to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import unittest
+import numpy as np
+from ballistics import GRADIENT_PARAMETERS, calculate_initial_velocity, lane2012_gradients, lane2012_height
+
+class TestLane2012Gradients(unittest.TestCase):
+
+    def setUp(self):
+        """Random designs within the Morris study bounds, with s_0 and b varied as well."""
+        rng = np.random.default_rng(3)
+        n = 50
+        self.params = {
+            'd_p': rng.uniform(2e-5, 1e-4, n),
+            'u_g': rng.uniform(100, 600, n),
+            'g': rng.uniform(1.62, 9.8, n),
+            'C_d': rng.uniform(0.1, 1, n),
+            's_0': rng.uniform(0.02, 0.5, n),
+            'b': rng.uniform(0.01, 1, n),
+        }
+        self.result = lane2012_gradients(**self.params)
+
+    def test_values(self):
+        """v_0 matches calculate_initial_velocity, the landing range is a root and the apex a maximum."""
+        p, r = self.params, self.result
+        v_0 = [calculate_initial_velocity(C_d, 0.01, d_p, u_g, g, 0.01) for C_d, d_p, u_g, g in zip(p['C_d'], p['d_p'], p['u_g'], p['g'])]
+        np.testing.assert_allclose(r['v_0'], v_0)
+        self.assertTrue(np.all(np.isfinite(r['landing_range'])))
+
+        height = lambda y: lane2012_height(y, 0.01, 0.01, p['s_0'], p['b'], p['g'], r['v_0'])
+        np.testing.assert_allclose(height(r['landing_range']), 0, atol=1e-8)
+        fractions = np.linspace(0, 1, 2001)[:, None]
+        samples = height(0.01 + fractions * (r['landing_range'] - 0.01))
+        np.testing.assert_allclose(samples.max(axis=0), r['apex'], rtol=1e-5)
+
+    def test_gradients_match_finite_differences(self):
+        """Analytic derivatives agree with central finite differences."""
+        for name in GRADIENT_PARAMETERS:
+            step = 1e-6 * self.params[name]
+            plus = lane2012_gradients(**dict(self.params, **{name: self.params[name] + step}))
+            minus = lane2012_gradients(**dict(self.params, **{name: self.params[name] - step}))
+            for output in ['landing_range', 'apex']:
+                numeric = (plus[output] - minus[output]) / (2 * step)
+                np.testing.assert_allclose(self.result['d_' + output][name], numeric, rtol=1e-4, err_msg=f'{output}/{name}')
+
+    def test_not_lofted(self):
+        """Designs whose drag cannot overcome gravity (v_0 <= 0) get NaN, not a mirrored trajectory."""
+        result = lane2012_gradients(d_p=1e-3, u_g=[30, 300], g=1.62, C_d=0.5, s_0=0.1, b=0.05)
+        self.assertLess(result['v_0'][0], 0)
+        self.assertEqual(list(result['lofted']), [False, True])
+        for output in ['landing_range', 'apex']:
+            self.assertTrue(np.isnan(result[output][0]))
+            self.assertTrue(np.isfinite(result[output][1]))
+            for name in GRADIENT_PARAMETERS:
+                self.assertTrue(np.isnan(result['d_' + output][name][0]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import numpy as np
+from src.ballistics import calculate_trajectory
+from src.hazards import Box, Cylinder, find_impacts
+
+class TestHazards(unittest.TestCase):
+
+    def setUp(self):
+        """Kinematic trajectories fanned out over all azimuths, and a few structures."""
+        rng = np.random.default_rng(2)
+        n = 300
+        self.time_step = 0.01
+        self.azimuths = rng.uniform(0, 360, n)
+        self.trajectories = [calculate_trajectory(v_0, angle, 1.62, initial_position=(0, 0.01),
+                                                  time_step=self.time_step, max_time=20)
+                             for v_0, angle in zip(rng.uniform(5, 15, n), rng.uniform(10, 80, n))]
+        self.structures = [
+            Box('instrument', (20, 24), (-5, 5), (0, 3)),
+            Cylinder('lander', (-30, 10), 4, (0, 6)),
+            Box('mast', (5, 6), (20, 21), (0, 40)),
+        ]
+
+    def brute_force(self):
+        """All-pairs reference: first structure hit along each trajectory."""
+        hits = {}
+        for i, trajectory in enumerate(self.trajectories):
+            points = np.asarray(trajectory)
+            phi = np.radians(self.azimuths[i])
+            xyz = np.column_stack([points[:, 0] * np.cos(phi), points[:, 0] * np.sin(phi), points[:, 1]])
+            start, direction = xyz[:-1], np.diff(xyz, axis=0)
+            best = None
+            for j, structure in enumerate(self.structures):
+                t_enter, t_exit = structure.entry(start, direction)
+                segments = np.nonzero(t_enter <= t_exit)[0]
+                if segments.size:
+                    candidate = (segments[0], t_enter[segments[0]], j)
+                    if best is None or candidate < best:
+                        best = candidate
+            if best is not None:
+                hits[i] = (best[2], best[1])
+        return {i: j for i, (j, _) in hits.items()}
+
+    def test_matches_brute_force(self):
+        """Grid-accelerated impacts equal an all-pairs check."""
+        report = find_impacts(self.trajectories, self.structures, azimuths=self.azimuths, time_step=self.time_step)
+        found = {int(p): j for j, entry in enumerate(report) for p in entry['particles']}
+        expected = self.brute_force()
+        self.assertGreater(len(expected), 0)
+        self.assertEqual(found, expected)
+        for entry in report:
+            self.assertEqual(entry['count'], len(entry['particles']))
+            self.assertTrue(np.all(entry['energies'] > 0))
+
+    def test_straight_line_impact(self):
+        """A horizontal path at 1 m height hits the face of a box at x = 10."""
+        trajectory = [(x, 1.0) for x in np.arange(0, 20, 0.5)]
+        box = Box('wall', (10.2, 12), (-1, 1), (0, 2))
+        report = find_impacts([trajectory], [box], masses=2.0, horizontal_velocity=3.0)
+        self.assertEqual(report[0]['count'], 1)
+        np.testing.assert_allclose(report[0]['locations'][0], [10.2, 0, 1.0])
+        self.assertAlmostEqual(report[0]['energies'][0], 0.5 * 2.0 * 3.0**2)
+
+    def test_long_segments_keep_small_cells(self):
+        """100 m trajectory steps are split per cell, so metre-scale structures off the path are never tested."""
+        tested = []
+
+        class CountingBox(Box):
+            def entry(self, start, direction):
+                tested.append((self.name, len(start)))
+                return super().entry(start, direction)
+
+        rng = np.random.default_rng(3)
+        structures = [CountingBox(f'rock{i}', (x, x + 1), (y, y + 1), (0, 2))
+                      for i, (x, y) in enumerate(zip(rng.uniform(0, 400, 200), rng.uniform(5, 50, 200)))]
+        structures.append(CountingBox('target', (250, 251), (-0.5, 0.5), (0, 2)))
+        trajectory = [(x, 1.0) for x in np.arange(0, 401, 100)]
+        report = find_impacts([trajectory], structures, horizontal_velocity=10.0)
+        self.assertEqual(report[-1]['count'], 1)
+        np.testing.assert_allclose(report[-1]['locations'][0], [250, 0, 1.0])
+        self.assertEqual([name for name, _ in tested], ['target'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import sys, os
+import subprocess
+import unittest
+
+# Repository root, so the src package can be imported the way src/main.py does
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Modules only needed for plotting or analysis; compute-only imports must not load them
+HEAVY_MODULES = ['matplotlib', 'pandas', 'SALib']
+
+# Import-time budget for a compute-only entry point, in seconds
+IMPORT_BUDGET = 0.05
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed)
+print(','.join(loaded))
+"""
+
+class TestImportTime(unittest.TestCase):
+
+    def probe(self, module):
+        """Import a module in a fresh interpreter and report its import time and heavy dependencies."""
+        code = PROBE.format(module=module, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.split('\n')
+        elapsed = float(output[0])
+        loaded = [m for m in output[1].split(',') if m]
+        return elapsed, loaded
+
+    def test_compute_modules_skip_heavy_imports(self):
+        """Importing the compute modules and entry point must not load plotting or analysis packages."""
+        for module in ['src.ballistics', 'src.plume_model', 'src.output_utils', 'src.main']:
+            _, loaded = self.probe(module)
+            self.assertEqual(loaded, [], f'{module} imported {loaded}')
+
+    def test_main_import_budget(self):
+        """The compute-only entry point should import well within the budget."""
+        elapsed, _ = self.probe('src.main')
+        self.assertLess(elapsed, IMPORT_BUDGET)
+
+if __name__ == '__main__':
+    unittest.main()
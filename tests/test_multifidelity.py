@@ -0,0 +1,65 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from functools import partial
+import numpy as np
+from src.multifidelity import TIERS, TIER_MODELS, MultiFidelityScheduler, integrated_tier, kinematic_tier, regime_selector
+
+class TestMultiFidelityScheduler(unittest.TestCase):
+
+    def setUp(self):
+        """A mixed population spanning all three regimes."""
+        rng = np.random.default_rng(5)
+        n = 2000
+        self.scheduler = MultiFidelityScheduler(partial(regime_selector, use_lane2012=True), check_fraction=0.05,
+                                                max_error=None)
+        self.params = self.scheduler.prepare(d_p=10**rng.uniform(-6, -3.5, n), u_g=rng.uniform(5, 2000, n),
+                                             r=rng.uniform(0.1, 15, n))
+
+    def test_results_follow_selected_tiers(self):
+        """Every particle gets exactly the output of the tier chosen for it."""
+        result = self.scheduler.run(self.params)
+        tiers = regime_selector(self.params, use_lane2012=True)
+        np.testing.assert_array_equal(result['tier'], tiers)
+        self.assertEqual(set(tiers), {0, 1, 2})
+        for level, name in enumerate(TIERS):
+            members = tiers == level
+            expected = TIER_MODELS[name]({key: values[members] for key, values in self.params.items()})
+            np.testing.assert_allclose(result['landing_range'][members], expected['landing_range'])
+        self.assertEqual(set(self.scheduler.error_bounds()), {'kinematic', 'lane2012'})
+
+    def test_kinematic_tier_is_adequate_when_drag_is_negligible(self):
+        """Particles routed to the kinematic tier land close to where the integrated model puts them."""
+        params = self.scheduler.prepare(d_p=[2.5e-5, 5e-5, 2e-5], u_g=[10, 15, 8], r=[2, 5, 1])
+        np.testing.assert_array_equal(regime_selector(params), 0)
+        np.testing.assert_allclose(kinematic_tier(params)['landing_range'], integrated_tier(params)['landing_range'], atol=0.01)
+        np.testing.assert_allclose(kinematic_tier(params)['apex'], integrated_tier(params)['apex'], rtol=0.02)
+
+    def test_default_routing_skips_uncalibrated_lane2012(self):
+        """By default only the kinematic and integrated tiers are used, and their results are gated."""
+        self.assertEqual(set(regime_selector(self.params)), {0, 2})
+        scheduler = MultiFidelityScheduler(check_fraction=0.05)
+        result = scheduler.run(self.params)
+        self.assertLessEqual(scheduler.error_bounds()['kinematic']['max_error'], scheduler.max_error)
+        self.assertFalse(np.isnan(result['landing_range']).any())
+
+    def test_escalation(self):
+        """A tier whose cross-check error exceeds max_error is handed to the next tier."""
+        scheduler = MultiFidelityScheduler(partial(regime_selector, use_lane2012=True), check_fraction=0.05)
+        result = scheduler.run(self.params)
+        self.assertGreater(scheduler.stats['lane2012']['escalated'], 0)
+        self.assertNotIn(TIERS.index('lane2012'), set(result['tier']))
+        self.assertFalse(np.isnan(result['landing_range']).all())
+
+    def test_check_every(self):
+        """Cross-checks only run on every check_every-th batch."""
+        scheduler = MultiFidelityScheduler(check_every=2)
+        scheduler.run(self.params)
+        self.assertEqual(scheduler.error_bounds(), {})
+        scheduler.run(self.params)
+        self.assertGreater(scheduler.stats['kinematic']['checked'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+import numpy as np
+from src.result_store import ResultStore, ResultStoreWriter
+from src.population import evaluate_batch, population_params
+
+COLUMNS = ['d_p', 'u_g', 'r', 'v_0', 'launch_angle', 'landing_range', 'apex']
+
+class TestResultStore(unittest.TestCase):
+
+    def setUp(self):
+        """Write a population campaign, swept by particle diameter, in several batches."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'campaign')
+        rng = np.random.default_rng(6)
+        parts = []
+        with ResultStoreWriter(self.path, COLUMNS, index_columns=['d_p', 'r'], chunk_size=1000) as writer:
+            for d_p in np.linspace(1e-6, 50e-6, 10):
+                params = population_params(d_p=d_p, u_g=rng.uniform(500, 2000, 700), r=rng.uniform(0, 10, 700))
+                rows = dict(params, **evaluate_batch(params))
+                writer.append(rows)
+                parts.append({name: rows[name] for name in COLUMNS})
+        self.data = {name: np.concatenate([part[name] for part in parts]) for name in COLUMNS}
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_range_query_matches_full_scan(self):
+        """Indexed range queries return the same rows as filtering everything, skipping chunks that cannot match."""
+        store = ResultStore(self.path)
+        self.assertEqual(len(store), 7000)
+        self.assertEqual(len(store.chunks), 7)
+        where = {'d_p': (5e-6, 20e-6), 'r': (None, 3)}
+        result = store.query(where, columns=['d_p', 'r', 'landing_range'])
+        mask = (self.data['d_p'] >= 5e-6) & (self.data['d_p'] <= 20e-6) & (self.data['r'] <= 3)
+        self.assertGreater(mask.sum(), 0)
+        np.testing.assert_array_equal(np.sort(result['landing_range']), np.sort(self.data['landing_range'][mask]))
+        self.assertGreater(store.last_scan['skipped'], 0)
+        self.assertEqual(store.last_scan['rows_read'], mask.sum())
+
+    def test_aggregates(self):
+        """Histograms and summaries agree with NumPy on the matching rows."""
+        store = ResultStore(self.path)
+        where = {'d_p': (5e-6, 20e-6), 'u_g': (1000, None)}
+        mask = (self.data['d_p'] >= 5e-6) & (self.data['d_p'] <= 20e-6) & (self.data['u_g'] >= 1000)
+        edges = np.linspace(0, 2e5, 21)
+        counts, _ = store.histogram('landing_range', edges, where)
+        np.testing.assert_array_equal(counts, np.histogram(self.data['landing_range'][mask], bins=edges)[0])
+        summary = store.describe('apex', where)
+        self.assertEqual(summary['count'], mask.sum())
+        self.assertAlmostEqual(summary['mean'] / self.data['apex'][mask].mean(), 1.0)
+        self.assertEqual(store.count({'d_p': (1.0, None)}), 0)
+
+    def test_large_append_and_crash_recovery(self):
+        """One large append is split into chunks, and complete chunks are readable before close."""
+        path = os.path.join(self.tmpdir.name, 'large')
+        values = np.arange(25000, dtype=float)
+        writer = ResultStoreWriter(path, ['x'], index_columns=['x'], chunk_size=1000)
+        self.assertEqual(len(ResultStore(path)), 0)
+        writer.append({'x': values})
+        values[:] = -1  # Buffered rows are not affected by the caller's array
+        writer.append({'x': np.arange(25000, 25500)})
+
+        # Simulate a crash: the writer is never closed
+        store = ResultStore(path)
+        self.assertEqual(len(store), 25000)
+        self.assertEqual(len(store.chunks), 25)
+        np.testing.assert_array_equal(store.query({'x': (12345, 12347)})['x'], [12345, 12346, 12347])
+
+        writer.close()
+        store = ResultStore(path)
+        self.assertEqual(len(store), 25500)
+        self.assertEqual(store.count({'x': (24990, 25010)}), 21)
+
+        # A manifest line cut short by a crash is ignored
+        with open(os.path.join(path, 'manifest.jsonl'), 'a') as f:
+            f.write('{"name": "chunk_000')
+        self.assertEqual(len(ResultStore(path)), 25500)
+
+    def test_unknown_column(self):
+        """Queries on columns that are not stored are rejected."""
+        store = ResultStore(self.path)
+        with self.assertRaises(ValueError):
+            store.query({'C_d': (0, 1)})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import tempfile
+import unittest
+import numpy as np
+from src.service import TrajectoryService, FIELDS, evaluate_batch, parse_request, start_server
+
+class TestTrajectoryService(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.service = TrajectoryService(batch_window=0.05)
+        self.server = await start_server(self.service)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.server.close()
+        await self.server.wait_closed()
+        await self.service.stop()
+
+    async def query(self, request, path=None):
+        """Send one request on a fresh connection and return the decoded response line."""
+        if path is None:
+            reader, writer = await asyncio.open_connection('127.0.0.1', self.port, limit=2**24)
+        else:
+            reader, writer = await asyncio.open_unix_connection(path, limit=2**24)
+        writer.write(json.dumps(request).encode() + b'\n')
+        await writer.drain()
+        response = json.loads(await reader.readline())
+        if 'nbytes' in response:
+            response['data'] = await reader.readexactly(response['nbytes'])
+        writer.close()
+        return response
+
+    async def test_concurrent_requests_are_batched(self):
+        """Concurrent queries are answered correctly and coalesced into fewer batches."""
+        requests = [{'id': i, 'd_p': [1e-6 * (i + 1), 5e-6], 'u_g': 500 + 100 * i} for i in range(8)]
+        responses = await asyncio.gather(*(self.query(request) for request in requests))
+        for request, response in zip(requests, responses):
+            self.assertEqual(response['id'], request['id'])
+            expected = evaluate_batch(parse_request(request))
+            np.testing.assert_allclose(response['landing_range'], expected['landing_range'])
+        self.assertEqual(self.service.stats['requests'], 8)
+        self.assertLess(self.service.stats['batches'], 8)
+
+    async def test_binary_response(self):
+        """Binary responses carry the same values as JSON ones."""
+        request = {'id': 'b', 'd_p': [1e-6, 2e-6, 3e-6], 'u_g': 1000, 'format': 'binary'}
+        response = await self.query(request)
+        self.assertEqual(response['shape'], [3, len(FIELDS)])
+        data = np.frombuffer(response['data'], dtype=response['dtype']).reshape(response['shape'])
+        expected = evaluate_batch(parse_request(request))
+        np.testing.assert_allclose(data[:, FIELDS.index('apex')], expected['apex'])
+
+    async def test_invalid_request(self):
+        """Missing inputs are reported without breaking the service."""
+        response = await self.query({'id': 3, 'd_p': 1e-6})
+        self.assertIn('u_g', response['error'])
+        response = await self.query({'id': 4, 'd_p': 1e-6, 'u_g': 800})
+        self.assertEqual(len(response['v_0']), 1)
+        response = await asyncio.wait_for(self.query({'id': 6, 'd_p': {'a': 1}, 'u_g': 800}), 5)
+        self.assertIn('d_p', response['error'])
+
+    async def test_non_finite_outputs_are_null(self):
+        """Outputs that are not finite are sent as JSON null."""
+        reader, writer = await asyncio.open_connection('127.0.0.1', self.port)
+        writer.write(json.dumps({'id': 7, 'd_p': [0, 1e-6], 'u_g': 1000}).encode() + b'\n')
+        line = await reader.readline()
+        writer.close()
+        self.assertNotIn(b'NaN', line)
+        response = json.loads(line)
+        self.assertIsNone(response['v_0'][0])
+        self.assertIsNotNone(response['v_0'][1])
+
+    async def test_large_request(self):
+        """A single request larger than the default stream limit is answered."""
+        d_p = np.geomspace(1e-6, 1e-4, 10000).tolist()
+        response = await asyncio.wait_for(self.query({'id': 8, 'd_p': d_p, 'u_g': 1000}), 10)
+        self.assertEqual(len(response['landing_range']), 10000)
+
+    async def test_oversized_request(self):
+        """A request over max_request_bytes gets an error and the connection stays usable."""
+        service = TrajectoryService(batch_window=0, max_request_bytes=1024)
+        server = await start_server(service)
+        try:
+            reader, writer = await asyncio.open_connection('127.0.0.1', server.sockets[0].getsockname()[1])
+            writer.write(json.dumps({'id': 9, 'd_p': [1e-6] * 1000, 'u_g': 1000}).encode() + b'\n')
+            writer.write(json.dumps({'id': 10, 'd_p': 1e-6, 'u_g': 1000}).encode() + b'\n')
+            await writer.drain()
+            first = json.loads(await asyncio.wait_for(reader.readline(), 5))
+            second = json.loads(await asyncio.wait_for(reader.readline(), 5))
+            writer.close()
+            self.assertIn('1024 bytes', first['error'])
+            self.assertEqual(second['id'], 10)
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+
+    async def test_unix_socket(self):
+        """The service can listen on a Unix socket."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'mddm.sock')
+            service = TrajectoryService(batch_window=0)
+            server = await start_server(service, path=path)
+            try:
+                response = await self.query({'id': 5, 'd_p': 1e-5, 'u_g': 1000}, path=path)
+                self.assertEqual(response['id'], 5)
+            finally:
+                server.close()
+                await server.wait_closed()
+                await service.stop()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+import numpy as np
+from src.ballistics import calculate_trajectory_lane2012, kinematic_landing
+from src.shared_workers import lane2012_population, kinematic_population
+
+class TestSharedWorkers(unittest.TestCase):
+
+    def test_lane2012_population_matches_serial(self):
+        """Trajectories written by workers match calculate_trajectory_lane2012 point for point."""
+        inputs = np.array([
+            [1, 0.1, 0.1, 0.05, 1.62, 500],
+            [0.01, 0.88779, 0.03662, 4.361, 1.62, 1983],
+            [0.01, 6.7215, 0.1089, 59.28, 1.62, 191],
+        ] * 3)
+        with lane2012_population(inputs, max_points=3000, max_workers=2, chunk_size=2) as result:
+            for i, row in enumerate(inputs):
+                trajectory = calculate_trajectory_lane2012(*row, 100)
+                self.assertEqual(result.lengths[i], len(trajectory))
+                np.testing.assert_allclose(result.trajectories[i, :len(trajectory)], [point[1] for point in trajectory])
+                self.assertTrue(np.isnan(result.trajectories[i, len(trajectory):]).all())
+                # The landing point lies between the last stored point and the next step
+                self.assertGreaterEqual(result.landing[i], trajectory[-1][0])
+                self.assertLessEqual(result.landing[i], trajectory[-1][0] + 100)
+
+    def test_kinematic_population(self):
+        """Worker results match the in-process closed-form evaluation."""
+        v_0 = np.linspace(1, 50, 101)
+        angle = np.linspace(10, 80, 101)
+        expected_landing, expected_apex = kinematic_landing(v_0, angle, 1.62)
+        with kinematic_population(v_0, angle, 1.62, max_workers=2) as result:
+            np.testing.assert_allclose(result.landing, expected_landing)
+            np.testing.assert_allclose(result.apex, expected_apex)
+
+if __name__ == '__main__':
+    unittest.main()
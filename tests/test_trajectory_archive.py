@@ -0,0 +1,71 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+import numpy as np
+from src.ballistics import calculate_initial_velocity, calculate_trajectory
+from src.trajectory_archive import TrajectoryArchive, TrajectoryArchiveWriter
+
+class TestTrajectoryArchive(unittest.TestCase):
+
+    def setUp(self):
+        """Write kinematic trajectories for a range of particle diameters to an archive."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'run')
+        self.trajectories = {}
+        with TrajectoryArchiveWriter(self.path, param_names=['d_p', 'launch_angle']) as writer:
+            for i, d_p in enumerate([1e-6, 5e-6, 10e-6, 20e-6, 50e-6]):
+                v_0 = calculate_initial_velocity(0.5, 0.01, d_p, 1000, 1.62, time_step=0.01)
+                launch_angle = 30 + 10 * i
+                trajectory = calculate_trajectory(v_0, launch_angle, 1.62, initial_position=(0, 0.01), max_time=5)
+                particle_id = 100 + i
+                writer.add(particle_id, trajectory, {'d_p': d_p, 'launch_angle': launch_angle})
+                self.trajectories[particle_id] = trajectory
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_random_access(self):
+        """Any trajectory can be read back by particle id, in any order."""
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(len(archive), 5)
+        self.assertIsInstance(archive.coords, np.memmap)
+        for particle_id in [104, 100, 102]:
+            np.testing.assert_array_equal(archive.get(particle_id), np.asarray(self.trajectories[particle_id]))
+        self.assertEqual(archive.params(102)['launch_angle'], 50)
+        with self.assertRaises(KeyError):
+            archive.get(7)
+
+    def test_select_by_parameters(self):
+        """Particles can be selected by ranges of their input parameters."""
+        archive = TrajectoryArchive(self.path)
+        self.assertEqual(list(archive.select(d_p=(5e-6, 20e-6))), [101, 102, 103])
+        self.assertEqual(list(archive.select(d_p=(None, 10e-6), launch_angle=(45, None))), [102])
+
+    def test_index_is_memory_mapped_and_sorted(self):
+        """Ids written out of order are found through the memory-mapped, sorted index."""
+        path = os.path.join(self.tmpdir.name, 'unordered')
+        with TrajectoryArchiveWriter(path, param_names=['d_p']) as writer:
+            for particle_id in [42, 7, 19, 3]:
+                writer.add(particle_id, [(0, particle_id), (1, 0)], {'d_p': particle_id * 1e-6})
+        archive = TrajectoryArchive(path)
+        self.assertIsInstance(archive.index, np.memmap)
+        self.assertEqual(list(archive.ids()), [3, 7, 19, 42])
+        for particle_id in [42, 7, 19, 3]:
+            self.assertEqual(archive.get(particle_id)[0, 1], particle_id)
+            self.assertAlmostEqual(archive.params(particle_id)['d_p'], particle_id * 1e-6)
+        self.assertIn(19, archive)
+        self.assertNotIn(20, archive)
+        self.assertNotIn(100, archive)
+
+    def test_duplicate_id(self):
+        """Particle ids must be unique."""
+        with TrajectoryArchiveWriter(os.path.join(self.tmpdir.name, 'dup')) as writer:
+            writer.add(1, [(0, 0)])
+            with self.assertRaises(ValueError):
+                writer.add(1, [(0, 0)])
+
+if __name__ == '__main__':
+    unittest.main()
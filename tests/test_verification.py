@@ -0,0 +1,76 @@
+import sys, os
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+import numpy as np
+from src.verification import REFERENCE_CASES, _load_reference_curve, load_reference_curve, interpolate_loglog, model_curve, verify_cases
+
+class TestVerification(unittest.TestCase):
+
+    def setUp(self):
+        """Write reference curves sampled from the model itself to a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.reference_dir = self.tmpdir.name
+        for name, case in REFERENCE_CASES.items():
+            x, y = model_curve(case, x_max=30, num_points=2000)
+            x, y = x[::50], y[::50]
+            self.write_curve(name, x, y)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write_curve(self, name, x, y):
+        """Write a curve in the digitized 'x, y' CSV layout."""
+        with open(os.path.join(self.reference_dir, name + '.csv'), 'w') as f:
+            f.write("x, y\n")
+            for point in zip(x, y):
+                f.write(f"{point[0]}, {point[1]}\n")
+
+    def test_load_reference_curve_is_cached(self):
+        """Repeated loads of an unchanged file return the same arrays."""
+        path = os.path.join(self.reference_dir, 'C1.csv')
+        x1, y1 = load_reference_curve(path)
+        x2, y2 = load_reference_curve(path)
+        self.assertIs(x1, x2)
+        self.assertIs(y1, y2)
+        self.assertTrue(np.all(np.diff(x1) > 0))
+
+    def test_interpolate_loglog_power_law(self):
+        """Log-log interpolation is exact for a power law."""
+        x_model = np.geomspace(1, 100, 5)
+        x_ref = np.array([2.0, 7.5, 42.0, 1000.0])
+        result = interpolate_loglog(x_model, 3 * x_model**-1.5, x_ref)
+        np.testing.assert_allclose(result[:3], 3 * x_ref[:3]**-1.5)
+        self.assertTrue(np.isnan(result[3]))
+
+    def test_model_matches_its_own_curves(self):
+        """Verifying the model against curves sampled from it gives negligible error."""
+        metrics = verify_cases(reference_dir=self.reference_dir, max_workers=1)
+        self.assertEqual(set(metrics), set(REFERENCE_CASES))
+        for curve in metrics.values():
+            self.assertGreater(curve['n_valid'], 0)
+            self.assertLess(curve['max'], 1e-3)
+
+    def test_parallel_matches_serial(self):
+        """Process-pool verification gives the same metrics as the serial path."""
+        name = 'C2'
+        x, y = load_reference_curve(os.path.join(self.reference_dir, name + '.csv'))
+        self.write_curve(name, x, y * 2)  # Offset by log10(2) everywhere
+        serial = verify_cases(reference_dir=self.reference_dir, max_workers=1)
+        parallel = verify_cases(reference_dir=self.reference_dir, max_workers=2)
+        self.assertEqual(serial, parallel)
+        self.assertAlmostEqual(serial[name]['rms'], np.log10(2), places=3)
+
+    def test_parallel_uses_parent_cache(self):
+        """The parallel path loads curves through the parent's cache, once per file."""
+        verify_cases(reference_dir=self.reference_dir, max_workers=2)
+        before = _load_reference_curve.cache_info()
+        verify_cases(reference_dir=self.reference_dir, max_workers=2)
+        after = _load_reference_curve.cache_info()
+        self.assertEqual(after.misses, before.misses)
+        self.assertEqual(after.hits - before.hits, len(REFERENCE_CASES))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,24 +1,21 @@
 import sys, os
-# Add the src folder to the Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+# Add the repository root to the Python path so the src package can be imported
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
 import matplotlib.pyplot as plt
-import pandas as pd
-from ballistics import calculate_trajectory_lane2012
+from src.ballistics import calculate_trajectory_lane2012
+from src.verification import REFERENCE_CASES, LUNAR_GRAVITY, load_reference_curve, verify_cases
 
 class TestLane2012Trajectory(unittest.TestCase):
 
     def test_lane2012_trajectory(self):
         """Test the Lane 2012 ballistics model and plot the trajectory."""
         # Define the input parameters based on Lane 2012
-        g = 1.62        # Lunar gravity in m/s^2
+        g = LUNAR_GRAVITY
         max_distance = 30 # Max horizontal distance in meters for the trajectory
 
-        C1 = {'x_0':0.01, 'y_0':0.88779, 'D':1e-6, 'b':4.361, 's_0': 0.03662, 'v_0': 1983}
-        C2 = {'x_0':0.01, 'y_0':2.4428, 'D':1e-6, 'b':11.09, 's_0': 0.03389, 'v_0': 528.7}  
-        C3 = {'x_0':0.01, 'y_0':6.7215, 'D':1e-6, 'b':59.28, 's_0': 0.1089, 'v_0': 191}  
-        curves = {'C1':C1, 'C2':C2, 'C3':C3}
+        curves = REFERENCE_CASES
         results = {}
 
         for curve in curves:
@@ -37,16 +34,21 @@ class TestLane2012Trajectory(unittest.TestCase):
 
         self.plot_trajectory_compare(results)
 
+        # Compare against the digitized Lane 2012 curves when they are available
+        if all(os.path.exists(curve + '.csv') for curve in curves):
+            for curve, metrics in verify_cases(curves).items():
+                print(f"{curve}: RMS log10 error = {metrics['rms']:.3g}, max = {metrics['max']:.3g}")
+
     def plot_trajectory(self, trajectory, curve):
         """Plot the particle trajectory using matplotlib."""
         y_positions, x_positions = zip(*trajectory)
 
-        lane_data = pd.read_csv(curve+'.csv')
+        lane_x, lane_y = load_reference_curve(curve+'.csv')
 
 
         plt.figure(figsize=(10, 6))
         plt.plot(y_positions, x_positions, marker="o", linestyle="-", color="b", label = "Torres")
-        plt.plot(lane_data['x'], lane_data[' y'], marker="o", linestyle=":", color="r", label = "Lane")
+        plt.plot(lane_x, lane_y, marker="o", linestyle=":", color="r", label = "Lane")
         plt.title("Particle Trajectory Based on Lane 2012 Model")
         plt.xlabel("Horizontal Distance (m)")
         plt.ylabel("Vertical Distance (m)")